@@ -21,8 +21,17 @@ New shapes can be added directly through one click.
 
 import os
 import json
+import time
 import maya.cmds as cmds
-from PySide2 import QtWidgets, QtCore, QtUiTools
+from PySide2 import QtWidgets, QtCore
+
+import ui_cache
+import maya_batch
+from decorator import memoize
+
+# each time slice of link creation aims for this many ms so the window keeps repainting
+SLICE_MS = 16
+FIRST_CHUNK = 50
 
 def maya_error_handler(func):
     """Decorator for handling Maya operations and errors"""
@@ -34,19 +43,169 @@ def maya_error_handler(func):
             return None
     return wrapper
 
+class ChainMathSignals(QtCore.QObject):
+    """Signals of ChainMathTask; QRunnable cannot emit on its own."""
+    finished = QtCore.Signal(object)
+
+
+class ChainMathTask(QtCore.QRunnable):
+    """Compute (rotateZ, translateZ) per link on a QThreadPool worker; no Maya calls here."""
+
+    def __init__(self, link_count, z_offset):
+        super().__init__()
+        self.link_count = link_count
+        self.z_offset   = z_offset
+        self.signals    = ChainMathSignals()
+        # Python owns the task (ChainTool.math_task); Qt must not delete it after run()
+        self.setAutoDelete(False)
+
+    def run(self):
+        transforms = [(90 if i % 2 == 0 else 0, i * self.z_offset) for i in range(self.link_count)]
+        self.signals.finished.emit(transforms)
+
+
+class WindowCloseFilter(QtCore.QObject):
+    """Emits closed when the window it is installed on gets a close event."""
+    closed = QtCore.Signal()
+
+    def eventFilter(self, watched, event):
+        if event.type() == QtCore.QEvent.Close:
+            self.closed.emit()
+        return False
+
+
+class ChainBuilder(QtCore.QObject):
+    """
+    Create chain links in time-sliced chunks from the Qt event loop.
+
+    Maya commands must run on the main thread, so a zero-interval timer creates one chunk per
+    tick and sizes the next chunk to fit SLICE_MS. cancel(), or a chunk that fails, stops the
+    timer and removes everything this run created, including the shape if it was imported for
+    this chain.
+    """
+    progress  = QtCore.Signal(int)
+    finished  = QtCore.Signal(int)
+    cancelled = QtCore.Signal()
+    failed    = QtCore.Signal(str)
+
+    def __init__(self, shape, scale, transforms, imported_shape=False, parent=None):
+        super().__init__(parent)
+        self.shape          = shape
+        self.scale          = scale
+        self.transforms     = transforms
+        self.imported_shape = imported_shape
+        self.created        = []
+        self.index          = 0
+        self.chunk          = FIRST_CHUNK
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self._step)
+
+    def start(self):
+        self.timer.start()
+
+    def is_running(self):
+        return self.timer.isActive()
+
+    def _step(self):
+        start = time.perf_counter()
+        end   = min(self.index + self.chunk, len(self.transforms))
+        new_links = []
+        try:
+            # one chunk is queued and flushed to Maya as a single batch; a batch that fails undoes
+            # its own undo chunk, so rollback() only has to remove the chunks before this one
+            with maya_batch.batch() as batch_cmds:
+                for rotation, translate_z in self.transforms[self.index:end]:
+                    instance = batch_cmds.instance(self.shape)[0]
+                    batch_cmds.scale(*self.scale, instance)
+                    batch_cmds.setAttr(f"{instance}.rotateZ", rotation)
+                    batch_cmds.setAttr(f"{instance}.translateZ", translate_z)
+                    new_links.append(instance)
+        except Exception as error:
+            self.timer.stop()
+            self.rollback()
+            self.failed.emit(str(error))
+            return
+
+        self.created.extend(link.name for link in new_links)
+        self.index = end
+        self.progress.emit(self.index)
+
+        elapsed_ms = max((time.perf_counter() - start) * 1000.0, 0.1)
+        self.chunk = max(1, int(self.chunk * SLICE_MS / elapsed_ms))
+
+        if self.index >= len(self.transforms):
+            self.timer.stop()
+            self.finished.emit(self.index)
+
+    def cancel(self):
+        self.timer.stop()
+        self.rollback()
+        self.cancelled.emit()
+
+    def rollback(self):
+        """Delete the links created so far, and the shape when this run imported it."""
+        nodes = cmds.ls(self.created) if self.created else []
+        if self.imported_shape and cmds.objExists(self.shape):
+            nodes.append(self.shape)
+        if nodes:
+            cmds.delete(nodes)
+        self.created = []
+
+
 class ChainTool:
     """Main class for the Maya Chain Tool"""
 
     def __init__(self):
         self.config = self._load_or_create_config()
-        project_dir = cmds.workspace(query=True, rootDirectory=True)
-        self.ui_file = os.path.normpath(os.path.join(project_dir, "ui", "Chain_GUI.ui"))  # Corrected file name
+        project_dir = self._project_dir()
         self.window = None
+        self.builder = None
+        self.pending_chain = None
+        self.math_task = None
+        self.run_count = 0
+
+        # the .ui ships next to this script; the project folder is only a fallback
+        try:
+            self.ui_file = ui_cache.find_ui("Chain_GUI.ui", os.path.dirname(os.path.abspath(__file__)), project_dir)
+        except IOError as e:
+            cmds.warning(str(e))
+            self.ui_file = None
+
+        # workspaceChanged job, alive while the window is open; a Qt window cannot be its parent
+        self.workspace_job = None
+        self.close_filter  = None
+
+    @memoize(maxsize=1)
+    def _project_dir(self):
+        """Maya project root; cleared by _workspace_changed when the artist sets another project."""
+        return cmds.workspace(query=True, rootDirectory=True)
+
+    def _workspace_changed(self):
+        self._project_dir.cache_clear()
+        self.get_asset_folder.cache_clear()
+
+    def _start_workspace_job(self):
+        """Clear cached project paths on project changes while the window is open."""
+        self._kill_workspace_job()
+        # the project may have changed while the window was closed
+        self._workspace_changed()
+        self.workspace_job = cmds.scriptJob(event=["workspaceChanged", self._workspace_changed])
+
+        self.close_filter = WindowCloseFilter(self.window)
+        self.close_filter.closed.connect(self._kill_workspace_job)
+        self.window.installEventFilter(self.close_filter)
+
+    def _kill_workspace_job(self):
+        if self.workspace_job is not None and cmds.scriptJob(exists=self.workspace_job):
+            cmds.scriptJob(kill=self.workspace_job, force=True)
+        self.workspace_job = None
 
     def _load_or_create_config(self):
         """
         Load existing config or create a default one."""
-        project_dir = cmds.workspace(query=True, rootDirectory=True)
+        project_dir = self._project_dir()
         config_path = os.path.join(project_dir, "chain_tool_config.json")
         
         # Debug: Log the configuration file path
@@ -94,10 +253,11 @@ class ChainTool:
             combo_box.addItem("No shapes available")
             cmds.warning("No shapes found in the asset folder.")
 
+    @memoize(maxsize=1, cache_none=False)
     @maya_error_handler
     def get_asset_folder(self):
-        """Retrieve or create the asset folder path."""
-        project_dir = cmds.workspace(query=True, rootDirectory=True)
+        """Retrieve or create the asset folder path (cached; failures are retried)."""
+        project_dir = self._project_dir()
         asset_folder = os.path.join(project_dir, self.config['asset_folder'])
 
         if not os.path.exists(asset_folder):
@@ -153,42 +313,103 @@ class ChainTool:
             cmds.warning("Scale values must be positive.")
             return
         
+        if (self.builder is not None and self.builder.is_running()) or self.pending_chain:
+            cmds.warning("A chain is already being created.")
+            return
+
         # import shape if not already in the scene
         asset_folder = self.get_asset_folder()
         file_path = os.path.join(asset_folder, f"{selected_shape}.fbx")
+        imported_shape = False
         if not cmds.objExists(selected_shape) and os.path.exists(file_path):
             cmds.file(file_path, i=True, type="FBX")
+            imported_shape = True
 
         # calculate offsets and create chain
         bounding_box = cmds.exactWorldBoundingBox(selected_shape)
         z_length = abs(bounding_box[5] - bounding_box[2]) * scale_z
         z_offset = z_length * z_offset_percentage
 
-        for i in range(link_count):
-            instance = cmds.instance(selected_shape)[0]
-            cmds.scale(scale_x, scale_y, scale_z, instance)
-            rotation = 90 if i % 2 == 0 else 0
-            cmds.setAttr(f"{instance}.rotateZ", rotation)
-            cmds.setAttr(f"{instance}.translateZ", i * z_offset)
-
+        self.run_count += 1
+        self.pending_chain = {
+            'run': self.run_count,
+            'shape': selected_shape,
+            'scale': (scale_x, scale_y, scale_z),
+            'imported_shape': imported_shape,
+        }
+        self._set_running(True, link_count)
+
+        # link math runs on a worker; links are created in slices once it reports back
+        # keep a reference so the runnable lives until it has reported back
+        task = ChainMathTask(link_count, z_offset)
+        self.math_task = task
+        task.signals.finished.connect(lambda transforms, run=self.run_count: self._start_builder(transforms, run))
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _start_builder(self, transforms, run):
+        """Create the links computed by ChainMathTask, unless that run was cancelled meanwhile."""
+        chain = self.pending_chain
+        if chain is None or chain['run'] != run:
+            return
+        self.pending_chain = None
+
+        self.builder = ChainBuilder(chain['shape'], chain['scale'], transforms,
+                                    imported_shape=chain['imported_shape'], parent=self.window)
+        self.builder.progress.connect(self.window.progressChain.setValue)
+        self.builder.finished.connect(self._chain_finished)
+        self.builder.cancelled.connect(self._chain_cancelled)
+        self.builder.failed.connect(self._chain_failed)
+        self.builder.start()
+
+    def cancel_chain(self):
+        """Stop chain creation and remove everything it created."""
+        if self.builder is not None and self.builder.is_running():
+            self.builder.cancel()
+        elif self.pending_chain:
+            # still computing: drop the run and undo the shape import
+            chain = self.pending_chain
+            self.pending_chain = None
+            if chain['imported_shape'] and cmds.objExists(chain['shape']):
+                cmds.delete(chain['shape'])
+            self._chain_cancelled()
+
+    def _chain_finished(self, link_count):
+        self._set_running(False)
         cmds.inViewMessage(
-            message=f"Successfully created {link_count} instances of {selected_shape}.",
+            message=f"Successfully created {link_count} instances of {self.builder.shape}.",
             position='midCenter',
             fade=True
         )
 
+    def _chain_cancelled(self):
+        self._set_running(False)
+        self.window.progressChain.setValue(0)
+        cmds.inViewMessage(message="Chain creation cancelled.", position='midCenter', fade=True)
+
+    def _chain_failed(self, error):
+        self._set_running(False)
+        self.window.progressChain.setValue(0)
+        cmds.warning(f"Chain creation failed and was rolled back: {error}")
+
+    def _set_running(self, running, link_count=0):
+        """Toggle buttons and reset the progress bar for a run."""
+        self.window.btnCreateChain.setEnabled(not running)
+        self.window.btnCancelChain.setEnabled(running)
+        if running:
+            self.window.progressChain.setRange(0, link_count)
+            self.window.progressChain.setValue(0)
+
     def create_gui(self):
         """Create the main GUI window."""
         print(f"[DEBUG] Expected UI file path: {self.ui_file}")
-        if not os.path.exists(self.ui_file):
+        if not self.ui_file or not os.path.exists(self.ui_file):
             cmds.warning("UI file not found. Please ensure the file exists.")
             return
 
-        loader = QtUiTools.QUiLoader()
-        ui_file = QtCore.QFile(self.ui_file)
-        ui_file.open(QtCore.QFile.ReadOnly)
-        self.window = loader.load(ui_file, parent=None)
-        ui_file.close()
+        self.window = ui_cache.load_ui(self.ui_file)
+        self._start_workspace_job()
+        print(f"[DEBUG] UI loaded in {ui_cache.LOAD_TIMES[self.ui_file][0]:.1f} ms "
+              f"({ui_cache.LOAD_TIMES[self.ui_file][1]}).")
 
         try:
             # Connect UI elements to functions
@@ -196,6 +417,8 @@ class ChainTool:
             print("[DEBUG] Connected btnAddNewBaseShape.")
             self.window.btnCreateChain.clicked.connect(self.create_chain)
             print("[DEBUG] Connected btnCreateChain.")
+            self.window.btnCancelChain.clicked.connect(self.cancel_chain)
+            self.window.progressChain.setValue(0)
 
             # Populate shape menu
             self.populate_shape_menu()
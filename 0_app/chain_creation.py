@@ -18,6 +18,9 @@ import os
 import json
 import maya.cmds as cmds
 
+import maya_batch
+from decorator import memoize
+
 def maya_error_handler(func):
     """Decorator for handling Maya operations and errors"""
     def wrapper(*args, **kwargs):
@@ -38,9 +41,18 @@ class ChainTool:
         self.link_count_field = None
         self.config = self._load_or_create_config()
 
+    @memoize(maxsize=1)
+    def _project_dir(self):
+        """Maya project root; cleared by _workspace_changed when the artist sets another project."""
+        return cmds.workspace(query=True, rootDirectory=True)
+
+    def _workspace_changed(self):
+        self._project_dir.cache_clear()
+        self.get_asset_folder.cache_clear()
+
     def _load_or_create_config(self):
         """Load existing config or create a default one."""
-        project_dir = cmds.workspace(query=True, rootDirectory=True)
+        project_dir = self._project_dir()
         config_path = os.path.join(project_dir, "chain_tool_config.json")
         
         # Debug: Log the configuration file path
@@ -68,12 +80,12 @@ class ChainTool:
                     json.dump(default_config, file, indent=4)
             except Exception as e:
                 cmds.warning(f"Failed to create config file: {str(e)}")
-                return default_config
+            return default_config
 
 
     def _save_config(self):
         """Save the current configuration to the JSON file."""
-        project_dir = cmds.workspace(query=True, rootDirectory=True)
+        project_dir = self._project_dir()
         config_path = os.path.join(project_dir, "chain_tool_config.json")
 
         try:
@@ -82,10 +94,14 @@ class ChainTool:
         except Exception as e:
             cmds.warning(f"Failed to save config file: {str(e)}")
 
+        # the config may point at another asset folder now
+        self.get_asset_folder.cache_clear()
+
+    @memoize(maxsize=1, cache_none=False)
     @maya_error_handler
     def get_asset_folder(self):
-        """Retrieve or create the asset folder path."""
-        project_dir = cmds.workspace(query=True, rootDirectory=True)
+        """Retrieve or create the asset folder path (cached; failures are retried)."""
+        project_dir = self._project_dir()
         asset_folder = os.path.join(project_dir, self.config['asset_folder'])
 
         if not os.path.exists(asset_folder):
@@ -167,12 +183,14 @@ class ChainTool:
         z_length = abs(bounding_box[5] - bounding_box[2]) * scale_z
         z_offset = z_length * z_offset_percentage
 
-        for i in range(link_count):
-            instance = cmds.instance(selected_shape)[0]
-            cmds.scale(scale_x, scale_y, scale_z, instance)
-            rotation = 90 if i % 2 == 0 else 0
-            cmds.setAttr(f"{instance}.rotateZ", rotation)
-            cmds.setAttr(f"{instance}.translateZ", i * z_offset)
+        # queue per-link calls and send them to Maya in a few bulk flushes
+        with maya_batch.batch() as batch_cmds:
+            for i in range(link_count):
+                instance = batch_cmds.instance(selected_shape)[0]
+                batch_cmds.scale(scale_x, scale_y, scale_z, instance)
+                rotation = 90 if i % 2 == 0 else 0
+                batch_cmds.setAttr(f"{instance}.rotateZ", rotation)
+                batch_cmds.setAttr(f"{instance}.translateZ", i * z_offset)
 
         cmds.inViewMessage(
             message=f"Successfully created {link_count} instances of {selected_shape}.",
@@ -186,6 +204,8 @@ class ChainTool:
             cmds.deleteUI(self.window_name)
 
         cmds.window(self.window_name, title="Custom Chain Tool", widthHeight=(300, 400))
+        # cached project paths go stale when another project is set; the job dies with the window
+        cmds.scriptJob(event=["workspaceChanged", self._workspace_changed], parent=self.window_name)
         cmds.columnLayout(adjustableColumn=True)
 
         cmds.text(label="Select Chain Shape:")
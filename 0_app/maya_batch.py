@@ -0,0 +1,243 @@
+#******************************************************************************************************************************
+#content       = Command batching for maya.cmds
+#version       = 0.1.0
+#date          = October 18th
+#dependencies  = maya.cmds, maya.mel
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+#******************************************************************************************************************************
+
+"""
+Queue per-attribute Maya calls and send them as one bulk operation.
+
+Tools like create_chain pay one interpreter-to-Maya round trip per attribute and per link.
+CommandBatch looks like maya.cmds, but setAttr, scale, move, rotate and instance calls are only
+queued. The queue is flushed as a single MEL script (one mel.eval, one undo chunk) when the
+context exits or when it reaches max_queue entries:
+
+    with maya_batch.batch() as batch_cmds:
+        for i in range(link_count):
+            instance = batch_cmds.instance(selected_shape)[0]
+            batch_cmds.setAttr(f"{instance}.translateZ", i * z_offset)
+
+instance() returns a PendingNode placeholder which can be used in plug names like a real node
+name; after the flush it resolves to the name Maya actually gave the node. Any other command
+flushes the queue first, so call order stays the same as without batching.
+
+A batch is all or nothing: everything runs inside one undo chunk, and when the body or a flush
+raises (a MEL error stops the script after its earlier statements ran, and long batches have
+already been flushed every max_queue operations) the chunk is undone on exit. This relies on
+undo being enabled, as it is in an interactive session.
+"""
+
+import numbers
+
+import maya.cmds as cmds
+import maya.mel as mel
+
+# flush automatically once this many operations are queued
+MAX_QUEUE = 5000
+
+# attribute written by the transform commands
+TRANSFORM_ATTRS = {
+    "move":   "translate",
+    "rotate": "rotate",
+    "scale":  "scale",
+}
+
+
+class PendingNode(str):
+    """Placeholder name for a node whose creation is still queued."""
+
+    def __new__(cls, index):
+        node = super().__new__(cls, f"__batchNode{index}__")
+        node.index    = index
+        node.resolved = None
+        return node
+
+    @property
+    def name(self):
+        """Real node name once flushed, else the placeholder."""
+        return self.resolved or str(self)
+
+
+def _mel_value(value):
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return repr(value)
+    # numpy.bool_ is not a numbers.Integral, recognise it by its dtype
+    if value_type is bool or getattr(getattr(value, "dtype", None), "kind", None) == "b":
+        return str(int(value))
+    # numpy scalars (int64, float32, ...) register with the numbers ABCs
+    if isinstance(value, numbers.Integral):
+        return repr(int(value))
+    if isinstance(value, numbers.Real):
+        return repr(float(value))
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+class CommandBatch:
+    """maya.cmds proxy that queues attribute writes, transforms and instances."""
+
+    def __init__(self, max_queue=MAX_QUEUE, cmds_module=None, mel_module=None):
+        self.max_queue   = max_queue
+        self.flush_count = 0
+        self._cmds       = cmds_module or cmds
+        self._mel        = mel_module or mel
+        self._queue      = []
+        self._pending    = []      # PendingNodes created by the queued instance requests
+        self._nodes      = {}      # placeholder token -> PendingNode, kept across flushes
+        self._node_count = 0
+        self._sent       = False   # something reached Maya since __enter__
+
+    def __enter__(self):
+        self._sent = False
+        self._cmds.undoInfo(openChunk=True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        failed = exc_type is not None
+        try:
+            if not failed:
+                self.flush()
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if failed:
+                self.discard()
+            self._cmds.undoInfo(closeChunk=True)
+            # auto-flushes, and statements before a MEL error, are applied already; undo the
+            # whole chunk, but never when it is empty, or the artist's previous action goes
+            if failed and self._sent:
+                self._cmds.undo()
+                for node in self._nodes.values():
+                    node.resolved = None
+        return False
+
+    def __getattr__(self, name):
+        """Commands that are not batched run directly, after the queue is flushed."""
+        command = getattr(self._cmds, name)
+
+        def run(*args, **kwargs):
+            self.flush()
+            self._sent = True
+            return command(*[self._resolve(arg) for arg in args], **kwargs)
+
+        return run
+
+    def __len__(self):
+        return len(self._queue)
+
+    #************************************************************
+    # QUEUED COMMANDS
+    def setAttr(self, plug, *values, **kwargs):
+        """Queue a numeric or string attribute write; anything else runs directly."""
+        unsupported = set(kwargs) - {"type", "typ"}
+        attr_type   = kwargs.get("type", kwargs.get("typ"))
+        if unsupported or (attr_type not in (None, "string", "double3", "float3")) or not values:
+            return self.__getattr__("setAttr")(plug, *values, **kwargs)
+
+        self._push(("setAttr", plug, values, attr_type))
+
+    def instance(self, node, **kwargs):
+        """Queue an instance of node and return a list holding its PendingNode."""
+        unsupported = set(kwargs) - {"name", "n"}
+        if unsupported:
+            return self.__getattr__("instance")(node, **kwargs)
+
+        pending = PendingNode(self._node_count)
+        self._node_count += 1
+        self._pending.append(pending)
+        self._nodes[str(pending)] = pending
+        self._push(("instance", pending, node, kwargs.get("name", kwargs.get("n"))))
+        return [pending]
+
+    def move(self, x, y, z, *nodes, **kwargs):
+        return self._transform("move", x, y, z, nodes, kwargs)
+
+    def rotate(self, x, y, z, *nodes, **kwargs):
+        return self._transform("rotate", x, y, z, nodes, kwargs)
+
+    def scale(self, x, y, z, *nodes, **kwargs):
+        return self._transform("scale", x, y, z, nodes, kwargs)
+
+    def _transform(self, command, x, y, z, nodes, kwargs):
+        # relative, pivot or selection based transforms keep Maya's own command
+        if kwargs.get("absolute", kwargs.get("a", True)) is not True or set(kwargs) - {"absolute", "a"} or not nodes:
+            return self.__getattr__(command)(x, y, z, *nodes, **kwargs)
+
+        for node in nodes:
+            self._push(("setAttr", f"{node}.{TRANSFORM_ATTRS[command]}", (x, y, z), "double3"))
+
+    def _push(self, operation):
+        self._queue.append(operation)
+        if len(self._queue) >= self.max_queue:
+            self.flush()
+
+    #************************************************************
+    # FLUSH
+    def discard(self):
+        """Drop everything queued since the last flush."""
+        self._queue   = []
+        self._pending = []
+
+    def flush(self):
+        """Send the queued operations to Maya as one MEL script; return the created node names."""
+        if not self._queue:
+            return []
+
+        queue, pending = self._queue, self._pending
+        self.discard()
+
+        self._sent = True
+        created = self._mel.eval(self.build_script(queue)) or []
+        for node, real_name in zip(pending, created):
+            node.resolved = real_name
+
+        self.flush_count += 1
+        return list(created)
+
+    def build_script(self, queue):
+        """
+        MEL for one flush. Each statement sits on its own line; created node names are
+        collected in $created and returned so PendingNodes can be resolved.
+        """
+        lines = ["global proc string[] pyclassBatchFlush()", "{", "string $created[];", "string $node[];"]
+        slots = {}
+
+        for operation in queue:
+            if operation[0] == "instance":
+                _, pending, source, name = operation
+                flags = f"-name {_mel_value(name)} " if name else ""
+                slots[str(pending)] = len(slots)
+                lines.append(f"$node = `instance {flags}{self._plug_expression(source, slots)}`; "
+                             f"$created[{slots[str(pending)]}] = $node[0];")
+            else:
+                _, plug, values, attr_type = operation
+                lines.append(f"setAttr {self._plug_expression(plug, slots)}"
+                             f"{' -type ' + _mel_value(attr_type) if attr_type else ''} "
+                             f"{' '.join(_mel_value(value) for value in values)};")
+
+        lines += ["return $created;", "}", "pyclassBatchFlush();"]
+        return "\n".join(lines)
+
+    def _plug_expression(self, plug, slots):
+        node, _, attr = plug.partition(".")
+        if node in slots:
+            return f'($created[{slots[node]}] + ".{attr}")' if attr else f"$created[{slots[node]}]"
+        return _mel_value(self._resolve(plug))
+
+    def _resolve(self, value):
+        """Swap a flushed placeholder, alone or at the start of a plug, for the real node name."""
+        if not isinstance(value, str):
+            return value
+        node, dot, attr = value.partition(".")
+        pending = self._nodes.get(node)
+        if pending is None or pending.resolved is None:
+            return value
+        return pending.resolved + dot + attr
+
+
+def batch(max_queue=MAX_QUEUE):
+    """Context manager returning a CommandBatch that flushes on exit."""
+    return CommandBatch(max_queue=max_queue)
@@ -0,0 +1,480 @@
+#******************************************************************************************************************************
+#content       = Validation and statistics pass over the chain shape library
+#version       = 0.1.0
+#date          = October 18th
+#dependencies  = numpy, concurrent.futures
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+#******************************************************************************************************************************
+
+"""
+Check every FBX shape in the asset folders before an artist picks a broken one in create_chain.
+
+Each file is read with a small binary FBX reader (no Maya or FBX SDK needed, so the checks run
+in a process pool) and checked for:
+
+    parse      the file is a complete binary FBX
+    mesh       it holds at least one mesh
+    polygons   polygon count is within max_polygons
+    vertices   vertex count is within max_vertices
+    center     the bounding box is centered at the origin, as add_new_base_shape leaves it
+    transform  models carry no translate/rotate/scale (add_new_base_shape freezes them)
+    history    no deformers or bind poses were exported with the shape
+    name       a model is named like the file; create_chain looks the shape up by file name
+
+All results go into one JSON report. The next run reads it back and only re-checks files whose
+size or modification time changed; files that were merely touched are recognised by hash.
+
+    python 0_app/validate_assets.py                                  # 0_app/pre_made_chains
+    python 0_app/validate_assets.py --project D:/projects/chains     # + the project's asset folder
+    python 0_app/validate_assets.py my/shapes --report shapes.json --jobs 8 --full
+
+The exit code is 1 when any asset fails, so the command can gate a publish.
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+import hashlib
+import argparse
+import datetime
+import multiprocessing
+import concurrent.futures
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# bump when the checks change, so old reports are not reused
+VALIDATOR_VERSION = 2
+
+DEFAULT_FOLDERS = [os.path.join(HERE, "pre_made_chains")]
+DEFAULT_REPORT  = "asset_report.json"
+EXTENSIONS      = (".fbx",)
+
+# every link of a chain is an instance of the shape, so keep shapes light
+DEFAULT_SETTINGS = {
+    "max_polygons":     5000,
+    "max_vertices":     5000,
+    # allowed bounding box center offset, relative to the bounding box diagonal
+    "center_tolerance": 1e-2,
+}
+
+# fewer changed files than this are checked in this process; a pool would only add startup time
+POOL_MIN_FILES = 16
+
+# FBX object types that only appear when history came along with the shape
+HISTORY_TYPES = ("Deformer", "Pose")
+
+TRANSFORM_DEFAULTS = {
+    b"Lcl Translation": (0.0, 0.0, 0.0),
+    b"Lcl Rotation":    (0.0, 0.0, 0.0),
+    b"Lcl Scaling":     (1.0, 1.0, 1.0),
+}
+
+
+#*******************************************************************
+# FBX
+FBX_MAGIC = b"Kaydara FBX Binary  \x00"
+
+SCALAR_FORMATS = {"Y": "<h", "C": "<?", "I": "<i", "L": "<q", "F": "<f", "D": "<d"}
+ARRAY_DTYPES   = {"f": "<f4", "d": "<f8", "l": "<i8", "i": "<i4", "b": "?"}
+
+
+class FbxError(ValueError):
+    """The file is not a readable binary FBX."""
+
+
+class FbxNode:
+    """One FBX node record; properties are only decoded when asked for."""
+    __slots__ = ("name", "children", "_data", "_offset", "_count", "_end")
+
+    def __init__(self, name, data, offset, count, end):
+        self.name     = name
+        self.children = []
+        self._data    = data
+        self._offset  = offset
+        self._count   = count
+        self._end     = end
+
+    def props(self):
+        data   = self._data
+        offset = self._offset
+        values = []
+        try:
+            for _ in range(self._count):
+                code = chr(data[offset])
+                offset += 1
+                if code in SCALAR_FORMATS:
+                    value = struct.unpack_from(SCALAR_FORMATS[code], data, offset)[0]
+                    offset += struct.calcsize(SCALAR_FORMATS[code])
+                elif code in ARRAY_DTYPES:
+                    length, encoding, stored = struct.unpack_from("<III", data, offset)
+                    offset += 12
+                    raw = bytes(data[offset:offset + stored])
+                    offset += stored
+                    if encoding:
+                        raw = zlib.decompress(raw)
+                    dtype = np.dtype(ARRAY_DTYPES[code])
+                    if len(raw) != length * dtype.itemsize:
+                        raise FbxError(f"array in {self.name} holds {len(raw)} bytes, expected {length * dtype.itemsize}")
+                    value = np.frombuffer(raw, dtype=dtype)
+                elif code in "SR":
+                    length = struct.unpack_from("<I", data, offset)[0]
+                    offset += 4
+                    value = bytes(data[offset:offset + length])
+                    offset += length
+                else:
+                    raise FbxError(f"unknown property type {code!r} in {self.name}")
+                if offset > self._end:
+                    raise FbxError(f"properties of {self.name} run past the node")
+                values.append(value)
+        except (struct.error, zlib.error, IndexError) as error:
+            raise FbxError(f"broken property in {self.name}: {error}") from None
+        return values
+
+    def find(self, name):
+        for child in self.children:
+            if child.name == name:
+                return child
+        return None
+
+
+def read_fbx(path):
+    """Return (version, top-level FbxNodes) of a binary FBX file; raises FbxError."""
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    if not data.startswith(FBX_MAGIC):
+        if data.lstrip()[:1] == b";" or b"FBXHeaderExtension" in data[:1024]:
+            raise FbxError("ASCII FBX; export the shape as binary FBX")
+        raise FbxError("not an FBX file")
+    if len(data) < 27:
+        raise FbxError("file ends inside the FBX header")
+
+    version = struct.unpack_from("<I", data, 23)[0]
+    # 7.5 and later use 64 bit offsets in node records
+    header  = struct.Struct("<QQQB" if version >= 7500 else "<IIIB")
+    view    = memoryview(data)
+
+    def read_nodes(offset, end, build, top=False):
+        """
+        Walk one node list. Every record is bounds-checked, but FbxNodes are only created for
+        the top level and below Objects; Definitions and settings hold hundreds of records per file.
+        """
+        nodes = []
+        while offset < end:
+            if offset + header.size > len(data):
+                raise FbxError("file ends inside a node record")
+            node_end, count, props_length, name_length = header.unpack_from(data, offset)
+            if node_end == 0:
+                # null record: end of this node list (or of the top level)
+                return nodes, offset + header.size
+            name_start  = offset + header.size
+            props_start = name_start + name_length
+            props_end   = props_start + props_length
+            if node_end > end or node_end <= offset or props_end > node_end:
+                raise FbxError(f"node at byte {offset} points outside the file")
+
+            if build or top:
+                node = FbxNode(data[name_start:props_start].decode("ascii", "replace"),
+                               view, props_start, count, props_end)
+                nodes.append(node)
+                build_children = build or node.name == "Objects"
+            else:
+                node, build_children = None, False
+            if props_end < node_end:
+                children = read_nodes(props_end, node_end, build_children)[0]
+                if node is not None:
+                    node.children = children
+            offset = node_end
+        return nodes, offset
+
+    nodes, _ = read_nodes(27, len(data), False, top=True)
+    if not nodes or nodes[-1].name == "":
+        raise FbxError("no FBX nodes found")
+    if not any(node.name == "Objects" for node in nodes):
+        raise FbxError("file has no Objects section; it is truncated or empty")
+    return version, nodes
+
+def _object_name(props):
+    """Object names are stored as b'name\\x00\\x01Class'."""
+    return props[1].split(b"\x00\x01")[0].decode("utf-8", "replace")
+
+
+#*******************************************************************
+# CHECKS
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _problem(check, message):
+    return {"check": check, "message": message}
+
+def inspect_fbx(path, settings):
+    """Run every check on one file; returns (stats, errors, warnings)."""
+    stats    = {}
+    errors   = []
+    warnings = []
+
+    try:
+        version, nodes = read_fbx(path)
+        objects = next(node for node in nodes if node.name == "Objects")
+
+        meshes  = []
+        models  = []
+        history = []
+        for node in objects.children:
+            if node.name == "Geometry":
+                props = node.props()
+                if len(props) > 2 and props[2] == b"Mesh":
+                    meshes.append(node)
+            elif node.name == "Model":
+                models.append((_object_name(node.props()), node))
+            elif node.name in HISTORY_TYPES:
+                props = node.props()
+                history.append(f"{node.name} {props[2].decode('utf-8', 'replace') if len(props) > 2 else ''}".strip())
+
+        polygons  = 0
+        vertices  = 0
+        bbox_min  = np.full(3, np.inf)
+        bbox_max  = np.full(3, -np.inf)
+        for mesh in meshes:
+            points  = mesh.find("Vertices")
+            indices = mesh.find("PolygonVertexIndex")
+            if points is None or indices is None:
+                errors.append(_problem("mesh", "mesh without vertices or polygons"))
+                continue
+            points  = points.props()[0].reshape(-1, 3)
+            indices = indices.props()[0]
+            # the last vertex of every polygon is stored as -(index + 1)
+            polygons += int(np.count_nonzero(indices < 0))
+            vertices += len(points)
+            if len(points):
+                bbox_min = np.minimum(bbox_min, points.min(axis=0))
+                bbox_max = np.maximum(bbox_max, points.max(axis=0))
+
+        # decoded in here too: a corrupt Properties70 record is a parse problem, not a crash
+        transforms = []
+        for name, model in models:
+            properties = model.find("Properties70")
+            for entry in (properties.children if properties else []):
+                props = entry.props()
+                default = TRANSFORM_DEFAULTS.get(props[0]) if props else None
+                if default is not None and not np.allclose(props[4:7], default, atol=1e-6):
+                    transforms.append(_problem("transform", f"{name} has {props[0].decode()} {tuple(props[4:7])}; "
+                                                            "freeze transformations before export"))
+    except (ValueError, TypeError, AttributeError, OSError, StopIteration, IndexError) as error:
+        # FbxError is a ValueError; so are reshape(-1, 3) and decode() on damaged arrays and strings
+        return stats, [_problem("parse", str(error) or "incomplete FBX")], warnings
+
+    stats.update({"fbx_version": version, "meshes": len(meshes), "models": [name for name, _ in models],
+                  "polygons": polygons, "vertices": vertices})
+
+    if not meshes or not vertices:
+        errors.append(_problem("mesh", "no polygon mesh in the file"))
+    if polygons > settings["max_polygons"]:
+        errors.append(_problem("polygons", f"{polygons} polygons, limit is {settings['max_polygons']}"))
+    if vertices > settings["max_vertices"]:
+        errors.append(_problem("vertices", f"{vertices} vertices, limit is {settings['max_vertices']}"))
+
+    if vertices:
+        center   = (bbox_min + bbox_max) / 2.0
+        diagonal = float(np.linalg.norm(bbox_max - bbox_min))
+        stats["bbox"]   = [bbox_min.tolist(), bbox_max.tolist()]
+        stats["center"] = center.tolist()
+        if float(np.linalg.norm(center)) > settings["center_tolerance"] * max(diagonal, 1.0):
+            errors.append(_problem("center", "bounding box center is at ({:.4g}, {:.4g}, {:.4g}), not the origin"
+                                             .format(*center)))
+
+    errors.extend(transforms)
+
+    if history:
+        errors.append(_problem("history", f"exported with {', '.join(sorted(set(history)))}; "
+                                          "delete history before export"))
+
+    shape_name = os.path.splitext(os.path.basename(path))[0]
+    if models and shape_name not in stats["models"]:
+        errors.append(_problem("name", f"no model named {shape_name}; found {', '.join(stats['models'])}"))
+    if len(models) > 1:
+        warnings.append(_problem("name", f"{len(models)} models in one shape file"))
+
+    return stats, errors, warnings
+
+def check_asset(path, settings, previous_hash=None):
+    """
+    Validate one file and return its report entry (runs in the worker processes).
+    When the content hash equals previous_hash, only {"path", "sha1", "unchanged": True} is returned.
+    """
+    stat   = os.stat(path)
+    digest = file_hash(path)
+    if previous_hash is not None and digest == previous_hash:
+        return {"path": path, "sha1": digest, "mtime_ns": stat.st_mtime_ns, "unchanged": True}
+
+    start = time.perf_counter()
+    stats, errors, warnings = inspect_fbx(path, settings)
+    return {
+        "path":     path,
+        "size":     stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha1":     digest,
+        "ok":       not errors,
+        "errors":   errors,
+        "warnings": warnings,
+        "stats":    stats,
+        "check_ms": round((time.perf_counter() - start) * 1000.0, 3),
+    }
+
+
+#*******************************************************************
+# LIBRARY
+def find_assets(folders):
+    paths = []
+    for folder in folders:
+        if not os.path.isdir(folder):
+            print(f"[validate_assets] skipping missing folder {folder}")
+            continue
+        for entry in os.scandir(folder):
+            if entry.is_file() and entry.name.lower().endswith(EXTENSIONS):
+                paths.append(os.path.normpath(entry.path))
+    return sorted(paths)
+
+def project_asset_folder(project_dir):
+    """The asset folder ChainTool uses for project_dir, read from its chain_tool_config.json."""
+    folder = "assets"
+    try:
+        with open(os.path.join(project_dir, "chain_tool_config.json"), 'r') as file:
+            folder = json.load(file).get("asset_folder", folder)
+    except (OSError, ValueError):
+        pass
+    return os.path.join(project_dir, folder)
+
+def load_report(report_path):
+    try:
+        with open(report_path, 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def _pool_context():
+    """Spawn workers with mayapy when running inside the Maya GUI, whose executable is maya.exe."""
+    context    = multiprocessing.get_context("spawn")
+    executable = os.path.basename(sys.executable).lower()
+    if executable.startswith("maya") and not executable.startswith("mayapy"):
+        mayapy = os.path.join(os.path.dirname(sys.executable), "mayapy" + os.path.splitext(sys.executable)[1])
+        if os.path.exists(mayapy):
+            context.set_executable(mayapy)
+    return context
+
+def _run_checks(jobs, settings, workers):
+    """jobs: [(path, previous_hash)]; yields report entries as they finish."""
+    if workers == 1 or len(jobs) < POOL_MIN_FILES:
+        for path, previous_hash in jobs:
+            yield check_asset(path, settings, previous_hash)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+        # chunks keep inter-process overhead low for large libraries of small files
+        chunk = max(1, len(jobs) // (workers * 8))
+        yield from pool.map(check_asset, [path for path, _ in jobs], [settings] * len(jobs),
+                            [previous_hash for _, previous_hash in jobs], chunksize=chunk)
+
+def validate(folders=None, report_path=DEFAULT_REPORT, workers=None, full=False, **settings):
+    """
+    Validate every asset in folders and write the report; returns the report dict.
+    Entries of unchanged files are taken from the previous report unless full is set.
+    """
+    start    = time.perf_counter()
+    folders  = [os.path.abspath(folder) for folder in (folders or DEFAULT_FOLDERS)]
+    settings = dict(DEFAULT_SETTINGS, **settings)
+
+    previous = load_report(report_path)
+    reusable = (not full and previous is not None
+                and previous.get("validator_version") == VALIDATOR_VERSION
+                and previous.get("settings") == settings)
+    old_assets = previous["assets"] if reusable else {}
+
+    assets = {}
+    jobs   = []
+    for path in find_assets(folders):
+        old  = old_assets.get(path)
+        stat = os.stat(path)
+        if old and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+            assets[path] = old
+        else:
+            # same size but a new mtime may just be a touch: the worker compares hashes first
+            same_size = old is not None and old["size"] == stat.st_size
+            jobs.append((path, old["sha1"] if same_size else None))
+
+    for entry in _run_checks(jobs, settings, workers):
+        path = entry["path"]
+        if entry.pop("unchanged", False):
+            entry = dict(old_assets[path], mtime_ns=entry["mtime_ns"])
+        assets[path] = entry
+
+    failed = sorted(path for path, entry in assets.items() if not entry["ok"])
+    report = {
+        "validator_version": VALIDATOR_VERSION,
+        "generated":         datetime.datetime.now().isoformat(timespec="seconds"),
+        "folders":           folders,
+        "settings":          settings,
+        "summary": {
+            "assets":    len(assets),
+            "failed":    len(failed),
+            "checked":   len(jobs),
+            "reused":    len(assets) - len(jobs),
+            "polygons":  sum(entry["stats"].get("polygons", 0) for entry in assets.values()),
+            "vertices":  sum(entry["stats"].get("vertices", 0) for entry in assets.values()),
+            "seconds":   round(time.perf_counter() - start, 3),
+        },
+        "failed": failed,
+        "assets": dict(sorted(assets.items())),
+    }
+
+    tmp_path = report_path + ".tmp"
+    with open(tmp_path, 'w') as file:
+        json.dump(report, file, indent=4)
+    os.replace(tmp_path, report_path)
+    return report
+
+
+#*******************************************************************
+# START
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the chain shape library in parallel.")
+    parser.add_argument("folders", nargs="*", help="asset folders (default: 0_app/pre_made_chains)")
+    parser.add_argument("--project", help="Maya project root; adds its chain tool asset folder")
+    parser.add_argument("--report", default=DEFAULT_REPORT, help=f"JSON report path (default: {DEFAULT_REPORT})")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--full", action="store_true", help="re-check every file, ignoring the previous report")
+    parser.add_argument("--max-polygons", type=int, default=DEFAULT_SETTINGS["max_polygons"])
+    parser.add_argument("--max-vertices", type=int, default=DEFAULT_SETTINGS["max_vertices"])
+    parser.add_argument("--center-tolerance", type=float, default=DEFAULT_SETTINGS["center_tolerance"])
+    args = parser.parse_args(argv)
+
+    folders = list(args.folders) or list(DEFAULT_FOLDERS)
+    if args.project:
+        folders.append(project_asset_folder(args.project))
+
+    report  = validate(folders, args.report, args.jobs, args.full, max_polygons=args.max_polygons,
+                       max_vertices=args.max_vertices, center_tolerance=args.center_tolerance)
+    summary = report["summary"]
+
+    for path in report["failed"]:
+        print(f"FAIL {path}")
+        for problem in report["assets"][path]["errors"]:
+            print(f"     {problem['check']:<10} {problem['message']}")
+    print(f"{summary['assets']} assets, {summary['failed']} failed "
+          f"({summary['checked']} checked, {summary['reused']} unchanged) in {summary['seconds']:.2f} s")
+    print(f"Report: {os.path.abspath(args.report)}")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 ::@echo off 
 
 set "SCRIPT_PATH=O:/pythons/"
-set "PYTHONPATH = %SCRIPT_PATH%;%PYTHONPATH%"
+set "PYTHONPATH=%SCRIPT_PATH%;%PYTHONPATH%"
 
 set "MAYA_PLUG_IN_PATH=%SCRIPT_PATH%plugins/;%MAYA_PLUG_IN_PATH%"
 set "MAYA_SHELF_PATH=%SCRIPT_PATH%shelf;%MAYA_SHELF_PATH%"
@@ -0,0 +1,123 @@
+#******************************************************************************************************************************
+
+#content       = Import-time report for the studio tools
+
+#version       = 0.1.0
+
+#date          = October 18th
+
+#dependencies  = python -X importtime
+
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+
+#******************************************************************************************************************************
+
+"""
+List cumulative import time per module for each tool entry point.
+
+Every entry point script is executed in a fresh interpreter under "-X importtime" (its
+__main__ block does not run) and the timings are summed per module. Run it with mayapy to
+see what Maya startup really pays:
+
+    python 1_tools/import_report.py
+    python 1_tools/import_report.py --python "C:/Program Files/Autodesk/Maya2024/bin/mayapy.exe" --top 15
+    python 1_tools/import_report.py --json import_times.json
+
+If an entry point fails to import (no Maya outside mayapy, for example), the modules imported
+before the failure are still reported together with the error.
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# entry point -> script defining it
+ENTRY_POINTS = {
+    "launch_chain_tool":         os.path.join(REPO, "0_app", "chain_creation.py"),
+    "execute_the_class_ar_load": os.path.join(REPO, "2_style", "21_arload.py"),
+    "SimpleUI":                  os.path.join(REPO, "4_ui", "simpleUI.py"),
+}
+
+# tool folders put on PYTHONPATH, as the Maya environment does
+TOOL_DIRS = ["0_app", "1_tools", "2_style", "3_advanced", "4_ui"]
+
+# written to stderr right before the entry script runs; interpreter startup is not counted
+START_MARKER = "import_report: start"
+
+
+def run_entry_point(script, python=sys.executable):
+    """Import script in a fresh interpreter; return (importtime rows, error text or None)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([os.path.join(REPO, folder) for folder in TOOL_DIRS]
+                                        + [env.get("PYTHONPATH", "")]).rstrip(os.pathsep)
+    code = (f"import sys, runpy, pkgutil; sys.stderr.write({START_MARKER!r} + '\\n'); sys.stderr.flush(); "
+            f"runpy.run_path({script!r}, run_name='import_report')")
+
+    result = subprocess.run([python, "-X", "importtime", "-c", code],
+                            env=env, capture_output=True, text=True)
+
+    rows    = []
+    errors  = []
+    started = False
+    for line in result.stderr.splitlines():
+        if line == START_MARKER:
+            started = True
+            continue
+        if not started:
+            continue
+        if not line.startswith("import time:"):
+            errors.append(line)
+            continue
+        raw    = line[len("import time:"):].split("|")
+        fields = [field.strip() for field in raw]
+        if not fields[0].isdigit():
+            continue          # header line
+        # nesting is the indent after "| ", two spaces per level, so read it before stripping
+        name  = raw[2]
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append({"module": fields[2], "self_us": int(fields[0]),
+                     "cumulative_us": int(fields[1]), "depth": depth})
+
+    error = "\n".join(line for line in errors if line.strip()) if result.returncode else None
+    return rows, error
+
+def summarize(rows):
+    """Return (total_us, rows sorted by cumulative time)."""
+    total = sum(row["cumulative_us"] for row in rows if row["depth"] == 0)
+    return total, sorted(rows, key=lambda row: row["cumulative_us"], reverse=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cumulative import time per module for each tool entry point.")
+    parser.add_argument("entry_points", nargs="*", default=list(ENTRY_POINTS),
+                        help=f"any of {', '.join(ENTRY_POINTS)} (default: all)")
+    parser.add_argument("--python", default=sys.executable, help="interpreter to measure, e.g. mayapy")
+    parser.add_argument("--top", type=int, default=20, help="modules listed per entry point")
+    parser.add_argument("--json", help="also write the full report to this file")
+    args = parser.parse_args(argv)
+
+    report = {}
+    for entry_point in args.entry_points:
+        rows, error = run_entry_point(ENTRY_POINTS[entry_point], args.python)
+        total, ranked = summarize(rows)
+        report[entry_point] = {"total_us": total, "error": error, "modules": ranked}
+
+        print(f"\n{entry_point}  ({os.path.relpath(ENTRY_POINTS[entry_point], REPO)})"
+              f"  total {total / 1000.0:.1f} ms over {len(rows)} modules")
+        print(f"  {'module':<40} {'cumulative ms':>14} {'self ms':>10}")
+        for row in ranked[:args.top]:
+            print(f"  {row['module']:<40} {row['cumulative_us'] / 1000.0:>14.2f} {row['self_us'] / 1000.0:>10.2f}")
+        if error:
+            print(f"  import stopped: {error.splitlines()[-1]}")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent=4)
+        print(f"\nSaved report to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
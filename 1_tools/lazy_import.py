@@ -0,0 +1,51 @@
+#******************************************************************************************************************************
+
+#content       = Lazy-import bootstrap
+
+#version       = 0.1.0
+
+#date          = October 18th
+
+#dependencies  = importlib
+
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+
+#******************************************************************************************************************************
+
+"""
+Defer heavy modules until first attribute access.
+
+lazy_import() registers a module in sys.modules through importlib's LazyLoader: the module
+object exists right away, but its code only runs when an attribute is first read.
+
+    from lazy_import import lazy_import
+    arSaveAs = lazy_import("arSaveAs")     # nothing runs yet
+    arSaveAs.start(new_file=False)         # module executes here
+
+Use it in place of the import statement. A plain "import name" or "from name import x" of a
+lazy module reads its attributes and therefore loads it straight away.
+"""
+
+import sys
+import importlib.util
+
+
+def lazy_import(name):
+    """Return name as a lazily executed module; already imported modules are returned as they are."""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'", name=name)
+
+    loader      = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module      = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+def is_loaded(module):
+    """False while a lazy module has not executed yet."""
+    return not isinstance(module, importlib.util._LazyModule)
@@ -18,21 +18,19 @@ Handles file operations, sorting, and updating UI elements dynamically based on
 import os
 import re
 import sys
-import shutil
-import getpass
 import datetime
-import subprocess
 
-from Qt import QtWidgets, QtGui, QtCore, QtCompat
+from Qt import QtWidgets, QtGui, QtCore
 
 import libLog
-import libData
+import ui_cache
 import libFunc
-import arNotice
-import arSaveAs
 
-from tank import Tank
 from arUtil import ArUtil
+from lazy_import import lazy_import
+
+# only the "add folder" action needs it, so it loads on first attribute access
+arSaveAs = lazy_import("arSaveAs")
 
 TITLE = "load"
 LOG   = libLog.init(script=TITLE)
@@ -44,8 +42,8 @@ class ArLoad(ArUtil):
         super(ArLoad, self).__init__()
         path_ui         = os.path.join(os.path.dirname(__file__), "ui", f"{TITLE}.ui")
 
-        # load UI layout
-        self.wgLoad     = QtCompat.loadUi(path_ui)
+        # load UI layout from the compiled cache
+        self.wgLoad     = ui_cache.load_ui(path_ui)
         self.load_dir   = ''
         self.load_file  = ''
     
@@ -1,6 +1,6 @@
 #******************************************************************************************************************************
 
-#content       = Assignment 
+#content       = Assignment
 
 #date          = November 7, 2024
 
@@ -11,33 +11,143 @@
 #******************************************************************************************************************************
 
 """
- Enables color override on specified controls and sets their color in Maya.
+ Enables color override on controls and sets their color in Maya.
+
+ colorize() works on whole hierarchies or name patterns: it resolves every shape in a few queries,
+ picks a color per control from a rule table and writes all overrides in one batched pass.
 """
+import fnmatch
+
 import maya.cmds as mc
 #VScodes keep telling me mc is not defined
 
-def set_color(ctrlList=None, color=None):
+import maya_batch
+
+# instead of using if statements, I created a dictionary
+COLOR_MAP = {
+    1:4,
+    2:13,
+    3:25,
+    4:17,
+    5:17,
+    6:15,
+    7:6,
+    8:16
+}
+
+# (name pattern, color) - first match wins; color is an index or an (R, G, B) tuple in 0-1
+DEFAULT_RULES = [
+    ("L_*", 6),      # blue
+    ("l_*", 6),
+    ("R_*", 13),     # red
+    ("r_*", 13),
+    ("C_*", 17),     # yellow
+    ("c_*", 17),
+    ("M_*", 17),
+]
+
+
+def _short_name(path):
+    return path.rsplit("|", 1)[-1]
+
+def _match_rule(name, rules):
+    for pattern, color in rules:
+        if fnmatch.fnmatchcase(name, pattern):
+            return color
+    return None
+
+def _find_shapes(roots=None, patterns=None, shape_type="nurbsCurve"):
+    """
+    Map each control transform (full path) to its shapes: one query for roots, two for
+    patterns, however many controls there are. Parents come from the shape's full path, not
+    from one listRelatives per control. Intermediate (orig) shapes are left out.
+    """
+    shapes = []
+    if roots:
+        shapes += mc.listRelatives(roots, allDescendents=True, type=shape_type, fullPath=True,
+                                   noIntermediate=True) or []
+    if patterns:
+        transforms = mc.ls(patterns, type="transform", long=True) or []
+        if transforms:
+            shapes += mc.listRelatives(transforms, shapes=True, type=shape_type, fullPath=True,
+                                       noIntermediate=True) or []
+
+    controls = {}
+    for shape in shapes:
+        parent = shape.rsplit("|", 1)[0]
+        if shape not in controls.setdefault(parent, []):
+            controls[parent].append(shape)
+    return controls
 
-    # instead of using if statements, I created a dictionary 
-    color_map = {
-        1:4,
-        2:13,
-        3:25,
-        4:17,
-        5:17,
-        6:15,
-        7:6,
-        8:16
-    }
-
-    for ctrlName in ctrlList:
-        try:
-            mc.setAttr(ctrlName + 'Shape.overrideEnabled', 1)
-    
-            if color in color_map:
-                mc.setAttr(ctrlName + 'Shape.overrideColor', color_map[color])
-
-        except:
-            pass
+def _queue_color(batch_cmds, shape, color):
+    batch_cmds.setAttr(shape + ".overrideEnabled", 1)
+    if isinstance(color, (tuple, list)):
+        batch_cmds.setAttr(shape + ".overrideRGBColors", 1)
+        batch_cmds.setAttr(shape + ".overrideColorRGB", *color)
+    else:
+        batch_cmds.setAttr(shape + ".overrideRGBColors", 0)
+        batch_cmds.setAttr(shape + ".overrideColor", color)
 
+def colorize(roots=None, patterns=None, rules=None, color=None, shape_type="nurbsCurve"):
+    """
+    Color the controls under roots and/or matching patterns.
+
+    Each control gets the first rule matching its short name, or color when given.
+    Returns one report entry per control:
+        {"control": path, "shapes": [...], "color": value, "status": "applied" or "skipped", "reason": str}
+    """
+    rules    = DEFAULT_RULES if rules is None else rules
+    controls = _find_shapes(roots, patterns, shape_type)
+    report   = []
+    to_apply = []
+
+    for control, shapes in controls.items():
+        value = color if color is not None else _match_rule(_short_name(control), rules)
+        entry = {"control": control, "shapes": shapes, "color": value, "status": "skipped", "reason": ""}
+        if value is None:
+            entry["reason"] = "no matching rule"
+        else:
+            to_apply.append(entry)
+        report.append(entry)
+
+    # plain names that resolved to nothing are reported instead of silently ignored
+    found = {_short_name(control) for control in controls} | set(controls)
+    for name in patterns or []:
+        if not any(char in name for char in "*?[") and name not in found:
+            report.append({"control": name, "shapes": [], "color": color, "status": "skipped",
+                           "reason": f"no {shape_type} shape found"})
+
+    if not to_apply:
+        return report
+
+    try:
+        with maya_batch.batch() as batch_cmds:
+            for entry in to_apply:
+                for shape in entry["shapes"]:
+                    _queue_color(batch_cmds, shape, entry["color"])
+        for entry in to_apply:
+            entry["status"] = "applied"
+
+    except RuntimeError:
+        # a locked or connected attribute fails the whole batch; redo per control to find it
+        for entry in to_apply:
+            try:
+                for shape in entry["shapes"]:
+                    _queue_color(mc, shape, entry["color"])
+                entry["status"] = "applied"
+            except RuntimeError as error:
+                entry["reason"] = str(error).strip()
+
+    return report
+
+def set_color(ctrlList=None, color=None):
+    """Old entry point: color the given controls with a COLOR_MAP index, reporting what was skipped."""
+    if color not in COLOR_MAP:
+        mc.warning(f"Unknown color {color}; expected one of {sorted(COLOR_MAP)}.")
+        return []
 
+    report = colorize(patterns=ctrlList or [], color=COLOR_MAP[color])
+    for entry in report:
+        if entry["status"] == "skipped":
+            mc.warning(f"Skipped {entry['control']}: {entry['reason']}")
+    return report
@@ -10,9 +10,23 @@
 
 #******************************************************************************************************************************
 
+import os
 import time
+import pickle
+import hashlib
+import inspect
+import tempfile
+import functools
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
+# disk tier of memoize(disk=True): one pickle per entry, grouped per function
+MEMO_DIR = os.environ.get("PYCLASS_MEMO_CACHE",
+                          os.path.join(os.path.expanduser("~"), ".cache", "pyclass_memo"))
+
+_MISSING = object()
+
 def print_process(func):
     def wrapper(*args, **kwargs):
         # Get function name
@@ -39,6 +53,252 @@ def print_process(func):
         return result
     return wrapper
 
+
+class _MemoCache:
+    """LRU entries and counters of one memoized function, or of one instance for methods."""
+
+    def __init__(self, maxsize):
+        self.maxsize   = maxsize
+        self.entries   = OrderedDict()   # key -> (expires, stamp, value)
+        self.hits      = 0
+        self.disk_hits = 0
+        self.misses    = 0
+        self.lock      = threading.Lock()
+
+    def put(self, key, stamp, value, expires):
+        with self.lock:
+            self.entries[key] = (expires, stamp, value)
+            self.entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+
+    def info(self, maxsize, ttl):
+        with self.lock:
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "size": len(self.entries), "maxsize": maxsize, "ttl": ttl}
+
+
+class Memoized:
+    """
+    Callable returned by memoize().
+
+    Methods (class attributes, or a first parameter named self) get one cache per instance,
+    kept with the bound method in the instance's __dict__ like functools.cached_property, so
+    caches die with their tool and one instance never sees another's results. Use the cache
+    controls through the instance:
+        self.get_asset_folder.cache_clear()
+    """
+
+    def __init__(self, func, maxsize, ttl, disk, validate, cache_none):
+        functools.update_wrapper(self, func)
+        parameters = list(inspect.signature(func).parameters)
+
+        self.func         = func
+        self.maxsize      = maxsize
+        self.ttl          = ttl
+        self.validate     = validate
+        self.cache_none   = cache_none
+        self.per_instance = bool(parameters) and parameters[0] == "self"
+        self._attr        = f"_memo_{func.__name__}"
+        self._cache       = _MemoCache(maxsize)
+
+        self.disk_dir = None
+        if disk:
+            folder = disk if isinstance(disk, str) else MEMO_DIR
+            self.disk_dir = os.path.join(folder, f"{func.__module__}.{func.__qualname__}")
+        self._check_disk()
+
+    def __set_name__(self, owner, name):
+        # a class attribute is a method even when an inner decorator hides the self parameter
+        self.per_instance = True
+        self._check_disk()
+
+    def _check_disk(self):
+        if self.disk_dir and self.per_instance:
+            raise ValueError(f"{self.func.__qualname__}: the disk tier needs a plain function, "
+                             "instance state is not part of a disk key")
+
+    def __get__(self, instance, owner=None):
+        if instance is None or not self.per_instance:
+            return self
+        try:
+            bound = instance.__dict__.get(self._attr)
+        except AttributeError:
+            raise TypeError(f"{type(instance).__name__} has no __dict__ to hold the cache "
+                            f"of {self.func.__qualname__}") from None
+        # built once per instance; a shallow copy carries its original's, which is replaced
+        if bound is None or bound._instance is not instance:
+            bound = instance.__dict__[self._attr] = _BoundMemoized(self, instance)
+        return bound
+
+    def __call__(self, *args, **kwargs):
+        if self.per_instance:
+            # called through the class, e.g. ChainTool.get_asset_folder(tool)
+            return self.__get__(args[0])(*args[1:], **kwargs)
+        return self._call(self._cache, args, args, kwargs)
+
+    @staticmethod
+    def _key(args, kwargs):
+        return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+    def _call(self, cache, call_args, key_args, kwargs):
+        key   = self._key(key_args, kwargs)
+        stamp = self.validate(*call_args, **kwargs) if self.validate else None
+        # entries without a ttl never expire (expires is inf), so skip the clock read
+        now   = time.monotonic() if self.ttl is not None else 0.0
+
+        # inlined rather than a _MemoCache method: this runs on every call
+        with cache.lock:
+            entry = cache.entries.get(key)
+            if entry is not None:
+                if entry[0] > now and entry[1] == stamp:
+                    cache.entries.move_to_end(key)
+                    cache.hits += 1
+                    return entry[2]
+                del cache.entries[key]
+
+        if self.disk_dir:
+            value = self._disk_get(key, stamp)
+            if value is not _MISSING:
+                with cache.lock:
+                    cache.disk_hits += 1
+                cache.put(key, stamp, value, self._expires(now))
+                return value
+
+        with cache.lock:
+            cache.misses += 1
+        # computed outside the lock: concurrent misses may both run func, like functools.lru_cache
+        value = self.func(*call_args, **kwargs)
+        if value is None and not self.cache_none:
+            return value
+
+        cache.put(key, stamp, value, self._expires(now))
+        if self.disk_dir:
+            self._disk_put(key, stamp, value)
+        return value
+
+    def _expires(self, now):
+        return float("inf") if self.ttl is None else now + self.ttl
+
+    #*******************************************************************
+    # DISK
+    def _disk_path(self, key):
+        # keys are hashed through repr, so disk-cached arguments need a stable repr (str, int, tuple)
+        return os.path.join(self.disk_dir, hashlib.sha1(repr(key).encode("utf-8")).hexdigest() + ".pkl")
+
+    def _disk_get(self, key, stamp):
+        try:
+            with open(self._disk_path(key), 'rb') as file:
+                expires, stored_stamp, value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return _MISSING
+        # wall clock here: monotonic time does not survive a restart
+        if (expires is not None and expires <= time.time()) or stored_stamp != stamp:
+            return _MISSING
+        return value
+
+    def _disk_put(self, key, stamp, value):
+        expires = None if self.ttl is None else time.time() + self.ttl
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            handle, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.disk_dir)
+            with os.fdopen(handle, 'wb') as file:
+                pickle.dump((expires, stamp, value), file, protocol=pickle.HIGHEST_PROTOCOL)
+            # other processes only ever see complete entries
+            os.replace(tmp_path, self._disk_path(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # an unpicklable result stays in memory only
+            pass
+
+    def _disk_remove(self, key=None):
+        if not self.disk_dir or not os.path.isdir(self.disk_dir):
+            return
+        paths = [self._disk_path(key)] if key is not None else \
+                [os.path.join(self.disk_dir, name) for name in os.listdir(self.disk_dir)]
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    #*******************************************************************
+    # CONTROL
+    def _check_unbound(self, action):
+        if self.per_instance:
+            raise TypeError(f"{self.func.__qualname__} caches per instance; "
+                            f"call {action} on the instance's method")
+
+    def cache_clear(self):
+        """Drop every entry, on disk too."""
+        self._check_unbound("cache_clear")
+        with self._cache.lock:
+            self._cache.entries.clear()
+        self._disk_remove()
+
+    def invalidate(self, *args, **kwargs):
+        """Drop the entry of one call signature, on disk too."""
+        self._check_unbound("invalidate")
+        key = self._key(args, kwargs)
+        with self._cache.lock:
+            self._cache.entries.pop(key, None)
+        if self.disk_dir:
+            self._disk_remove(key)
+
+    def cache_info(self):
+        self._check_unbound("cache_info")
+        return self._cache.info(self.maxsize, self.ttl)
+
+
+class _BoundMemoized:
+    """A Memoized method bound to one instance, holding that instance's cache."""
+    __slots__ = ("_memo", "_instance", "_cache")
+
+    def __init__(self, memo, instance):
+        self._memo     = memo
+        self._instance = instance
+        self._cache    = _MemoCache(memo.maxsize)
+
+    def __call__(self, *args, **kwargs):
+        return self._memo._call(self._cache, (self._instance,) + args, args, kwargs)
+
+    def cache_clear(self):
+        with self._cache.lock:
+            self._cache.entries.clear()
+
+    def invalidate(self, *args, **kwargs):
+        with self._cache.lock:
+            self._cache.entries.pop(self._memo._key(args, kwargs), None)
+
+    def cache_info(self):
+        return self._cache.info(self._memo.maxsize, self._memo.ttl)
+
+
+def memoize(func=None, *, maxsize=128, ttl=None, disk=False, validate=None, cache_none=True):
+    """
+    Cache results by arguments, bounded LRU.
+
+    maxsize    entries kept before the least recently used is dropped (None = unbounded)
+    ttl        seconds an entry stays valid (None = until invalidated)
+    disk       True or a folder: also keep results as pickles under MEMO_DIR (or that folder)
+               so they survive restarts; plain functions only
+    validate   called with the same arguments; an entry whose stored value differs is
+               recomputed, e.g. validate=lambda path: os.stat(path).st_mtime_ns
+    cache_none False to retry calls that returned None (maya_error_handler's failure value)
+
+        @memoize
+        def bounding_box(path): ...
+
+        @memoize(maxsize=1)
+        def get_asset_folder(self): ...
+
+    Every memoized callable has cache_clear(), invalidate(*args) and cache_info().
+    """
+    def decorate(func):
+        return Memoized(func, maxsize, ttl, disk, validate, cache_none)
+    return decorate(func) if func is not None else decorate
+
+
 @print_process
 def short_sleeping(name):
     time.sleep(0.1)
@@ -54,6 +314,16 @@ def long_sleeping():
     time.sleep(4)
     print("Long sleep complete")
 
-short_sleeping("so sleepy")
-mid_sleeping()
-long_sleeping()
\ No newline at end of file
+if __name__ == "__main__":
+    short_sleeping("so sleepy")
+    mid_sleeping()
+    long_sleeping()
+
+    @memoize(maxsize=2, ttl=1.0)
+    def slow_square(value):
+        time.sleep(0.5)
+        return value * value
+
+    slow_square(3)
+    slow_square(3)
+    print(slow_square.cache_info())
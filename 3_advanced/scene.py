@@ -0,0 +1,455 @@
+#******************************************************************************************************************************
+
+#content       = Array-backed scene for Object/Cube
+
+#version       = 0.1.0
+
+#date          = October 18th
+
+#dependencies  = numpy
+
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+
+#******************************************************************************************************************************
+
+"""
+Structure-of-arrays storage for large numbers of Object/Cube instances.
+
+Instead of three Python lists plus a color list per object, a Scene keeps translation, rotation,
+scale and color in contiguous NumPy arrays. ObjectHandle/CubeHandle are two-slot views into
+those arrays with the same API as Object/Cube in cube.py, and Scene.update_transform writes
+whole index ranges in one vectorized call.
+
+Objects can be parented. World matrices are cached: editing a local transform through the
+Scene or a handle marks only that object's subtree dirty, and querying world matrices
+recomputes the dirty rows level by level (parents before children) in vectorized passes.
+
+    scene = Scene()
+    cubes = scene.create_many([f"Cube{i}" for i in range(100000)])
+    scene.update_transform("translation", (0, 1, 0), slice(0, 50000))
+    cubes[7].set_parent(cubes[6])
+    cubes[7].rotate(45, 90, 180)
+    positions = scene.world_positions()
+
+Writing to the transform arrays directly bypasses dirty tracking; call mark_dirty afterwards.
+"""
+
+import numpy as np
+
+TRANSFORM_TYPES = ("translation", "rotation", "scaling")
+DEFAULT_CAPACITY = 1024
+NO_PARENT = -1
+
+# per-object arrays: name -> (row shape, dtype, initial value)
+ARRAY_LAYOUT = {
+    "translation": ((3,), np.float64, 0),
+    "rotation":    ((3,), np.float64, 0),
+    "scaling":     ((3,), np.float64, 1),
+    "coloring":    ((3,), np.uint8, 0),
+    "parent":      ((), np.int64, NO_PARENT),
+    "depth":       ((), np.int32, 0),
+    "_dirty":      ((), np.bool_, True),
+    "_world":      ((4, 4), np.float64, 0),
+}
+
+
+def compose_matrices(translation, rotation, scaling):
+    """
+    Local 4x4 matrices (column vectors, translation in the last column) for n objects.
+    Rotation is Euler XYZ in degrees, as in Maya: M = T * Rz * Ry * Rx * S.
+    """
+    rx, ry, rz = np.radians(rotation).T
+    cx, sx = np.cos(rx), np.sin(rx)
+    cy, sy = np.cos(ry), np.sin(ry)
+    cz, sz = np.cos(rz), np.sin(rz)
+
+    matrices = np.zeros((len(translation), 4, 4))
+    matrices[:, 0, 0] = cz * cy
+    matrices[:, 0, 1] = cz * sy * sx - sz * cx
+    matrices[:, 0, 2] = cz * sy * cx + sz * sx
+    matrices[:, 1, 0] = sz * cy
+    matrices[:, 1, 1] = sz * sy * sx + cz * cx
+    matrices[:, 1, 2] = sz * sy * cx - cz * sx
+    matrices[:, 2, 0] = -sy
+    matrices[:, 2, 1] = cy * sx
+    matrices[:, 2, 2] = cy * cx
+    matrices[:, :3, :3] *= scaling[:, None, :]
+    matrices[:, :3, 3] = translation
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+class Scene:
+    """Contiguous arrays holding the transforms and colors of every object in the scene."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, verbose=False):
+        # print a line per translate/rotate/scale/color like Object/Cube do; off for bulk work
+        self.verbose = verbose
+        self.count   = 0
+        self.names   = []
+        self._index  = {}
+        self._children  = {}       # parent index -> list of child indices
+        self._any_dirty = False
+        for name, (shape, dtype, fill) in ARRAY_LAYOUT.items():
+            setattr(self, name, np.full((max(1, capacity),) + shape, fill, dtype=dtype))
+
+    def _grow(self, needed):
+        capacity = len(self.translation)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+
+        for name, (shape, dtype, fill) in ARRAY_LAYOUT.items():
+            array = np.full((capacity,) + shape, fill, dtype=dtype)
+            array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+
+    @property
+    def capacity(self):
+        return len(self.translation)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, key):
+        """Handle by index or by name."""
+        index = self._index[key] if isinstance(key, str) else key
+        if not 0 <= index < self.count:
+            raise IndexError(f"Scene has no object at index {index}")
+        return CubeHandle(self, index)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    #************************************************************
+    # CREATE
+    def create(self, name, handle_type=None, parent=None):
+        """Append one object with identity transform and black color; return its handle."""
+        if name in self._index:
+            raise ValueError(f"Object named '{name}' already exists")
+
+        self._grow(self.count + 1)
+        index = self.count
+        self.names.append(name)
+        self._index[name] = index
+        self.count += 1
+        self._any_dirty = True
+        if parent is not None:
+            self.set_parent(index, parent)
+        return (handle_type or CubeHandle)(self, index)
+
+    def create_many(self, names, handle_type=None):
+        """Append many objects at once; return their handles."""
+        names = list(names)
+        duplicates = [name for name in names if name in self._index]
+        if duplicates or len(set(names)) != len(names):
+            raise ValueError(f"Duplicate object names: {duplicates[:5] or 'within the new names'}")
+
+        start = self.count
+        self._grow(start + len(names))
+        self.names.extend(names)
+        self._index.update(zip(names, range(start, start + len(names))))
+        self.count += len(names)
+        self._any_dirty = True
+
+        handle_type = handle_type or CubeHandle
+        return [handle_type(self, index) for index in range(start, self.count)]
+
+    def load_rows(self, indices, names, translation, rotation, scaling, coloring, parent):
+        """
+        Overwrite whole rows in bulk, appending rows whose index is past the end.
+        Used to restore snapshots; the hierarchy is rebuilt and the rows are marked dirty.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        end     = int(indices.max()) + 1 if len(indices) else self.count
+        if end > self.count:
+            self._grow(end)
+            self.names.extend([None] * (end - self.count))
+            self.count = end
+
+        for index, name in zip(indices.tolist(), names):
+            old_name = self.names[index]
+            if old_name is not None and self._index.get(old_name) == index:
+                del self._index[old_name]
+            self.names[index] = name
+            self._index[name] = index
+
+        for array, value in ((self.translation, translation), (self.rotation, rotation),
+                             (self.scaling, scaling), (self.coloring, coloring), (self.parent, parent)):
+            array[indices] = value
+
+        self._rebuild_hierarchy()
+        self.mark_dirty(indices)
+
+    @classmethod
+    def from_arrays(cls, names, translation, rotation, scaling, coloring, parent, verbose=False):
+        """Build a scene from whole per-object arrays in one pass."""
+        scene = cls(capacity=len(names), verbose=verbose)
+        scene.load_rows(np.arange(len(names)), names, translation, rotation, scaling, coloring, parent)
+        return scene
+
+    def _rebuild_hierarchy(self):
+        """Recompute children lists and depths from the parent array."""
+        parent = self.parent[:self.count]
+        self._children = {}
+        for child in np.flatnonzero(parent != NO_PARENT).tolist():
+            self._children.setdefault(int(parent[child]), []).append(child)
+
+        # one breadth-first pass from the roots, so a deep chain stays linear
+        depth = np.zeros(self.count, dtype=np.int32)
+        level = np.flatnonzero(parent == NO_PARENT).tolist()
+        current = 0
+        while level:
+            depth[level] = current
+            level = [child for node in level for child in self._children.get(node, ())]
+            current += 1
+        self.depth[:self.count] = depth
+
+    #************************************************************
+    # BULK EDIT
+    def _rows(self, indices):
+        """Normalise indices (None, slice, range, int or array) to something NumPy can index with."""
+        if indices is None:
+            return slice(0, self.count)
+        if isinstance(indices, range):
+            return slice(indices.start, indices.stop, indices.step)
+        return indices
+
+    def update_transform(self, ttype, value, indices=None):
+        """
+        Set translation, rotation or scaling for many objects in one vectorized write.
+
+        value is one (x, y, z) broadcast to every row or an (n, 3) array matching indices.
+        """
+        if ttype not in TRANSFORM_TYPES:
+            raise KeyError(f"Unknown transform type '{ttype}', expected one of {TRANSFORM_TYPES}")
+
+        rows = self._rows(indices)
+        getattr(self, ttype)[:self.count][rows] = value
+        self.mark_dirty(rows)
+
+    def set_color(self, value, indices=None):
+        """Set RGB (0-255) for many objects in one write."""
+        value = np.asarray(value)
+        if value.size and (value.min() < 0 or value.max() > 255):
+            raise ValueError("Color channels must be in the range 0-255")
+        self.coloring[:self.count][self._rows(indices)] = value
+
+    #************************************************************
+    # HIERARCHY
+    def _to_index(self, node):
+        if isinstance(node, ObjectHandle):
+            return node.index
+        if isinstance(node, str):
+            return self._index[node]
+        return int(node)
+
+    def children(self, node):
+        return list(self._children.get(self._to_index(node), ()))
+
+    def set_parent(self, child, parent=None):
+        """Parent child under parent (None for world); local transforms are kept as they are."""
+        child  = self._to_index(child)
+        parent = NO_PARENT if parent is None else self._to_index(parent)
+
+        if parent == child:
+            raise ValueError(f"Cannot parent '{self.names[child]}' under itself")
+        # only a node with children can end up under its own descendant
+        if self._children.get(child):
+            ancestor = parent
+            while ancestor != NO_PARENT:
+                if ancestor == child:
+                    raise ValueError(f"Cannot parent '{self.names[child]}' under its own descendant")
+                ancestor = int(self.parent[ancestor])
+
+        old_parent = self.parent[child]
+        if old_parent != NO_PARENT:
+            self._children[old_parent].remove(child)
+        if parent != NO_PARENT:
+            self._children.setdefault(parent, []).append(child)
+        self.parent[child] = parent
+
+        # depth of the moved subtree follows its new parent
+        offset = (0 if parent == NO_PARENT else self.depth[parent] + 1) - self.depth[child]
+        for node in self._subtree(child):
+            self.depth[node] += offset
+            self._dirty[node] = True
+        self._any_dirty = True
+
+    def _subtree(self, index):
+        stack = [index]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(self._children.get(node, ()))
+
+    def mark_dirty(self, indices=None):
+        """
+        Flag objects and their descendants for re-evaluation.
+
+        A dirty object always has dirty descendants, so single edits stop walking at any
+        subtree that is already dirty; bulk edits propagate one depth level at a time.
+        """
+        rows = self._rows(indices)
+        if isinstance(rows, (int, np.integer)):
+            stack = [int(rows)]
+            while stack:
+                node = stack.pop()
+                if self._dirty[node]:
+                    continue
+                self._dirty[node] = True
+                stack.extend(self._children.get(node, ()))
+            self._any_dirty = True
+            return
+
+        self._dirty[:self.count][rows] = True
+        self._any_dirty = True
+        if not self._children:
+            return
+
+        dirty  = self._dirty[:self.count]
+        parent = self.parent[:self.count]
+        depth  = self.depth[:self.count]
+        # group rows by depth once, as evaluate() does, instead of scanning depth per level
+        order  = np.argsort(depth, kind="stable")
+        levels = np.flatnonzero(np.diff(depth[order])) + 1
+        for nodes in np.split(order, levels)[1:]:
+            dirty[nodes] |= dirty[parent[nodes]]
+
+    def evaluate(self):
+        """Recompute world matrices of all dirty objects, parents before children."""
+        if not self._any_dirty:
+            return 0
+
+        dirty = np.flatnonzero(self._dirty[:self.count])
+        if len(dirty):
+            dirty  = dirty[np.argsort(self.depth[dirty], kind="stable")]
+            levels = np.flatnonzero(np.diff(self.depth[dirty])) + 1
+
+            for nodes in np.split(dirty, levels):
+                local   = compose_matrices(self.translation[nodes], self.rotation[nodes], self.scaling[nodes])
+                parents = self.parent[nodes]
+                world   = local
+                has_parent = parents != NO_PARENT
+                if has_parent.any():
+                    world[has_parent] = self._world[parents[has_parent]] @ local[has_parent]
+                self._world[nodes] = world
+
+            self._dirty[dirty] = False
+
+        self._any_dirty = False
+        return len(dirty)
+
+    def world_matrices(self, indices=None):
+        """World 4x4 matrices, evaluating dirty objects first."""
+        self.evaluate()
+        return self._world[:self.count][self._rows(indices)].copy()
+
+    def world_positions(self, indices=None):
+        """World space translation of each object."""
+        return self.world_matrices(indices)[..., :3, 3]
+
+
+class ObjectHandle:
+    """Object API over one row of a Scene."""
+
+    __slots__ = ("scene", "index")
+
+    def __init__(self, scene, index):
+        self.scene = scene
+        self.index = index
+
+    def __repr__(self):
+        return f"{type(self).__name__}('{self.name}')"
+
+    def __eq__(self, other):
+        return isinstance(other, ObjectHandle) and other.scene is self.scene and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self.scene), self.index))
+
+    @property
+    def name(self):
+        return self.scene.names[self.index]
+
+    @property
+    def translation(self):
+        return self.scene.translation[self.index].tolist()
+
+    @property
+    def rotation(self):
+        return self.scene.rotation[self.index].tolist()
+
+    @property
+    def scaling(self):
+        return self.scene.scaling[self.index].tolist()
+
+    def translate(self, x, y, z):
+        self.scene.translation[self.index] = (x, y, z)
+        self.scene.mark_dirty(self.index)
+        if self.scene.verbose:
+            print(f"{self.name} translated to: ({x}, {y}, {z})")
+
+    def rotate(self, x, y, z):
+        self.scene.rotation[self.index] = (x, y, z)
+        self.scene.mark_dirty(self.index)
+        if self.scene.verbose:
+            print(f"{self.name} rotated to: ({x}, {y}, {z})")
+
+    def scale(self, x, y, z):
+        self.scene.scaling[self.index] = (x, y, z)
+        self.scene.mark_dirty(self.index)
+        if self.scene.verbose:
+            print(f"{self.name} scaled to: ({x}, {y}, {z})")
+
+    @property
+    def parent(self):
+        index = self.scene.parent[self.index]
+        return None if index == NO_PARENT else type(self)(self.scene, int(index))
+
+    def set_parent(self, parent=None):
+        self.scene.set_parent(self.index, parent)
+
+    @property
+    def world_matrix(self):
+        return self.scene.world_matrices(self.index)
+
+    @property
+    def world_position(self):
+        return self.scene.world_positions(self.index).tolist()
+
+    def print_status(self):
+        pass
+
+
+class CubeHandle(ObjectHandle):
+    """Cube API over one row of a Scene."""
+
+    __slots__ = ()
+
+    @property
+    def coloring(self):
+        return self.scene.coloring[self.index].tolist()
+
+    def color(self, R, G, B):
+        self.scene.set_color((R, G, B), self.index)
+        if self.scene.verbose:
+            print(f"{self.name} color set to RGB: ({R}, {G}, {B})")
+
+    def print_status(self):
+        print(f"  Cube '{self.name}' Status:")
+        print(f"  Translation: {self.translation}")
+        print(f"  Rotation: {self.rotation}")
+        print(f"  Scale: {self.scaling}")
+        print(f"  Color: {self.coloring}")
+
+    def update_transform(self, ttype, value):
+        # Dictionary mapping transformation types to their corresponding methods
+        transform_methods = {
+            "translation": self.translate,
+            "rotation":    self.rotate,
+            "scaling":     self.scale
+        }
+        # Call the appropriate method with unpacked values
+        transform_methods[ttype](*value)
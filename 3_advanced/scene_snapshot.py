@@ -0,0 +1,304 @@
+#******************************************************************************************************************************
+
+#content       = Binary snapshots for Scene
+
+#version       = 0.1.0
+
+#date          = October 18th
+
+#dependencies  = numpy, mmap, scene
+
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+
+#******************************************************************************************************************************
+
+"""
+Versioned binary snapshot format for Scene (scene.py).
+
+A snapshot stores a whole scene as fixed-width arrays: names (NUL-padded UTF-8), translation,
+rotation, scale, color and parent index. Every section starts on a 64 byte boundary, so load()
+maps the file and hands out NumPy views straight into the mapping - opening a million-object
+layout only reads the header.
+
+Diff snapshots use the same layout plus an indices section and hold only the rows that changed
+since the previous snapshot. Each file records its own id and the id of the snapshot it
+follows, so load_scene() can check the chain:
+
+    snapshotter = Snapshotter(scene)
+    snapshotter.save("layout.snap")            # full
+    ...edit scene...
+    snapshotter.save_diff("layout.001.snap")   # changed rows only
+    scene = load_scene("layout.snap", "layout.001.snap")
+
+File layout (little endian):
+    header   HEADER_FORMAT, padded to HEADER_SIZE
+    sections one per SECTIONS entry, each aligned to ALIGNMENT; offset 0 = absent
+"""
+
+import os
+import mmap
+import uuid
+import struct
+
+import numpy as np
+
+from scene import Scene
+
+MAGIC        = b"PYCSNAP\0"
+VERSION      = 1
+FLAG_DIFF    = 1
+ALIGNMENT    = 64
+HEADER_SIZE  = 128
+
+# section name -> (dtype, row shape); names use a per-file fixed width
+SECTIONS = {
+    "indices":     (np.dtype("<i8"), ()),
+    "names":       (None, ()),
+    "translation": (np.dtype("<f8"), (3,)),
+    "rotation":    (np.dtype("<f8"), (3,)),
+    "scaling":     (np.dtype("<f8"), (3,)),
+    "coloring":    (np.dtype("u1"), (3,)),
+    "parent":      (np.dtype("<i8"), ()),
+}
+
+# magic, version, flags, name width, row count, scene count, snapshot id, base id, section offsets
+HEADER_FORMAT = "<8sHHIQQQQ" + "Q" * len(SECTIONS)
+
+ROW_ARRAYS = ("translation", "rotation", "scaling", "coloring", "parent")
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def _encode_names(names):
+    encoded = [name.encode("utf-8") for name in names]
+    # round to 8 bytes rather than the section alignment to keep names compact
+    width   = max(8, (max((len(name) for name in encoded), default=1) + 7) // 8 * 8)
+    return np.array(encoded, dtype=f"S{width}"), width
+
+def _write(path, sections, flags, scene_count, snapshot_id, base_id):
+    names, width = _encode_names(sections.pop("names_list"))
+    sections["names"] = names
+    row_count = len(names)
+
+    offsets = []
+    payload = []
+    offset  = HEADER_SIZE
+    for name in SECTIONS:
+        array = sections.get(name)
+        if array is None:
+            offsets.append(0)
+            continue
+        offset = _align(offset)
+        offsets.append(offset)
+        data = np.ascontiguousarray(array)
+        # an empty section (empty scene, diff without changes) keeps its offset but has no bytes
+        if data.nbytes:
+            payload.append((offset, data))
+        offset += data.nbytes
+
+    header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, flags, width, row_count,
+                         scene_count, snapshot_id, base_id, *offsets)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as file:
+        file.write(header.ljust(HEADER_SIZE, b"\0"))
+        for section_offset, data in payload:
+            file.write(b"\0" * (section_offset - file.tell()))
+            file.write(memoryview(data.reshape(-1)).cast("B"))
+    # a crash mid-write never leaves a truncated snapshot under the real name
+    os.replace(tmp_path, path)
+    return snapshot_id
+
+
+class Snapshot:
+    """Read-only view of a snapshot file; array attributes are zero-copy views into an mmap."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < HEADER_SIZE or self._map[:8] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a scene snapshot")
+
+        fields = struct.unpack_from(HEADER_FORMAT, self._map, 0)
+        (_, self.version, self.flags, self.name_width, self.row_count,
+         self.scene_count, self.snapshot_id, self.base_id) = fields[:8]
+        if self.version > VERSION:
+            self.close()
+            raise ValueError(f"{path} uses snapshot version {self.version}; this reader supports up to {VERSION}")
+
+        for (name, (dtype, shape)), offset in zip(SECTIONS.items(), fields[8:]):
+            if not offset:
+                setattr(self, name, None)
+                continue
+            dtype = dtype or np.dtype(f"S{self.name_width}")
+            count = self.row_count * int(np.prod(shape, dtype=np.int64))
+            if not count:
+                # empty sections have no bytes; their offset may lie past the end of the file
+                setattr(self, name, np.empty((0,) + shape, dtype=dtype))
+                continue
+            view  = np.frombuffer(self._map, dtype=dtype, count=count, offset=offset)
+            setattr(self, name, view.reshape((self.row_count,) + shape))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __len__(self):
+        return self.row_count
+
+    @property
+    def is_diff(self):
+        return bool(self.flags & FLAG_DIFF)
+
+    def name(self, row):
+        return self.names[row].decode("utf-8")
+
+    def decoded_names(self):
+        return [name.decode("utf-8") for name in self.names.tolist()]
+
+    def row_indices(self):
+        """Scene index of each stored row."""
+        return self.indices if self.is_diff else np.arange(self.row_count)
+
+    def close(self):
+        # views must be dropped before the map can close
+        for name in SECTIONS:
+            self.__dict__.pop(name, None)
+        try:
+            self._map.close()
+        except BufferError:
+            # a caller still holds one of the arrays; the map closes when it is released
+            pass
+
+    def apply_to(self, scene):
+        """Write this snapshot's rows into scene (copying out of the map)."""
+        scene.load_rows(self.row_indices(), self.decoded_names(),
+                        *(getattr(self, name) for name in ROW_ARRAYS))
+        return scene
+
+    def to_scene(self, verbose=False):
+        if self.is_diff:
+            raise ValueError(f"{self.path} is a diff snapshot; load it on top of its base with load_scene")
+        return Scene.from_arrays(self.decoded_names(), *(getattr(self, name) for name in ROW_ARRAYS),
+                                 verbose=verbose)
+
+
+def load(path):
+    """Map a snapshot file; nothing but the header is read until the arrays are touched."""
+    return Snapshot(path)
+
+def load_scene(path, *diff_paths):
+    """Build a Scene from a full snapshot followed by its diffs, in order."""
+    with Snapshot(path) as snapshot:
+        scene   = snapshot.to_scene()
+        last_id = snapshot.snapshot_id
+
+    for diff_path in diff_paths:
+        with Snapshot(diff_path) as diff:
+            if not diff.is_diff or diff.base_id != last_id:
+                raise ValueError(f"{diff_path} does not follow the previous snapshot in the chain")
+            diff.apply_to(scene)
+            last_id = diff.snapshot_id
+    return scene
+
+
+class Snapshotter:
+    """
+    Writes full and diff snapshots of one scene.
+
+    Keeps a copy of the rows as of the last snapshot so save_diff can find changed objects
+    with vectorized comparisons, independent of the scene's dirty flags.
+    """
+
+    def __init__(self, scene):
+        self.scene    = scene
+        self.last_id  = 0
+        self._base    = None
+
+    def _current(self):
+        count = self.scene.count
+        return {name: getattr(self.scene, name)[:count] for name in ROW_ARRAYS}
+
+    def _remember(self, snapshot_id):
+        self.last_id = snapshot_id
+        self._base   = {name: array.copy() for name, array in self._current().items()}
+        self._base["names"] = list(self.scene.names)
+
+    def save(self, path):
+        """Write the whole scene; later diffs are relative to this snapshot."""
+        sections = dict(self._current(), names_list=self.scene.names)
+        snapshot_id = _write(path, sections, 0, self.scene.count, uuid.uuid4().int & (2**64 - 1), 0)
+        self._remember(snapshot_id)
+        return snapshot_id
+
+    def changed_rows(self):
+        """Indices of objects added or changed since the last snapshot."""
+        current   = self._current()
+        base_rows = len(self._base["parent"])
+        changed   = np.zeros(self.scene.count, dtype=bool)
+        changed[base_rows:] = True
+
+        for name in ROW_ARRAYS:
+            old = self._base[name]
+            new = current[name][:base_rows]
+            differs = old != new
+            changed[:base_rows] |= differs.any(axis=1) if differs.ndim > 1 else differs
+
+        if self._base["names"] != self.scene.names[:base_rows]:
+            renamed = [index for index, (old, new) in enumerate(zip(self._base["names"], self.scene.names)) if old != new]
+            changed[renamed] = True
+        return np.flatnonzero(changed)
+
+    def save_diff(self, path):
+        """Write only the rows changed since the last snapshot; returns the number written."""
+        if self._base is None:
+            raise RuntimeError("save_diff needs a previous full snapshot; call save first")
+        if self.scene.count < len(self._base["parent"]):
+            raise ValueError("Objects were removed since the last snapshot; write a full snapshot instead")
+
+        rows     = self.changed_rows()
+        current  = self._current()
+        sections = {name: current[name][rows] for name in ROW_ARRAYS}
+        sections["indices"]    = rows.astype("<i8")
+        sections["names_list"] = [self.scene.names[index] for index in rows.tolist()]
+
+        snapshot_id = _write(path, sections, FLAG_DIFF, self.scene.count,
+                             uuid.uuid4().int & (2**64 - 1), self.last_id)
+        self._remember(snapshot_id)
+        return len(rows)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    # round trips, including the empty cases: an empty scene and a diff with nothing changed
+    folder = tempfile.mkdtemp()
+    path   = lambda name: os.path.join(folder, name)
+
+    empty = Snapshotter(Scene())
+    empty.save(path("empty.snap"))
+    assert load_scene(path("empty.snap")).count == 0
+
+    scene = Scene()
+    scene.create_many([f"cube{index}" for index in range(4)])
+    scene.update_transform("translation", (1.0, 2.0, 3.0), [1, 2])
+    snapshotter = Snapshotter(scene)
+    snapshotter.save(path("layout.snap"))
+
+    assert snapshotter.save_diff(path("layout.001.snap")) == 0
+    scene.update_transform("rotation", (0.0, 90.0, 0.0), [3])
+    scene.create("cube4")
+    assert snapshotter.save_diff(path("layout.002.snap")) == 2
+
+    loaded = load_scene(path("layout.snap"), path("layout.001.snap"), path("layout.002.snap"))
+    assert loaded.names == scene.names
+    for name in ROW_ARRAYS:
+        assert np.array_equal(getattr(loaded, name)[:loaded.count], getattr(scene, name)[:scene.count]), name
+    print(f"snapshot round trips ok ({folder})")
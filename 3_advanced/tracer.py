@@ -0,0 +1,292 @@
+#******************************************************************************************************************************
+
+#content       = Tracer
+
+#version       = 0.1.0
+
+#date          = October 18th
+
+#dependencies  = time.perf_counter_ns, threading
+
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+
+#******************************************************************************************************************************
+
+"""
+Low-overhead hierarchical tracing for nested and hot functions.
+
+Unlike print_process in decorator.py, spans are timed with time.perf_counter_ns, nested per thread
+and aggregated into per-function call counts and latency histograms. When tracing is disabled the
+decorator costs a single global lookup before calling the wrapped function.
+
+    import tracer
+    tracer.instrument(ChainTool)          # or decorate with @tracer.trace
+    tracer.enable()
+    ...
+    tracer.report()
+    tracer.export_chrome_trace("chain_tool_trace.json")   # open in chrome://tracing or Perfetto
+"""
+
+import os
+import json
+import time
+import inspect
+import threading
+import functools
+from collections import deque
+
+# tracing is off unless enabled in code or through the environment
+_enabled = os.environ.get("PYCLASS_TRACE", "") == "1"
+
+# keep the most recent spans only, so long sessions do not grow without bound
+MAX_EVENTS = 1000000
+
+# power-of-two nanosecond buckets: bucket n holds durations in [2**(n-1), 2**n)
+HISTOGRAM_BUCKETS = 64
+
+_events     = deque(maxlen=MAX_EVENTS)
+_registry   = []                 # per-thread stats dicts, merged on read
+_registry_lock = threading.Lock()
+_local      = threading.local()
+_clock      = time.perf_counter_ns
+
+
+class FunctionStats:
+    """Aggregated timings for one traced name."""
+
+    __slots__ = ("name", "count", "total_ns", "self_ns", "min_ns", "max_ns", "histogram")
+
+    def __init__(self, name):
+        self.name      = name
+        self.count     = 0
+        self.total_ns  = 0
+        self.self_ns   = 0
+        self.min_ns    = None
+        self.max_ns    = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, duration_ns, self_ns):
+        self.count    += 1
+        self.total_ns += duration_ns
+        self.self_ns  += self_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.histogram[min(duration_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def merge(self, other):
+        self.count    += other.count
+        self.total_ns += other.total_ns
+        self.self_ns  += other.self_ns
+        if other.min_ns is not None and (self.min_ns is None or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        for index, value in enumerate(other.histogram):
+            self.histogram[index] += value
+
+    def percentile(self, fraction):
+        """Upper bound in ns of the histogram bucket holding the given fraction of calls."""
+        if not self.count:
+            return 0
+        threshold = fraction * self.count
+        seen = 0
+        for index, value in enumerate(self.histogram):
+            seen += value
+            if seen >= threshold:
+                return min(1 << index, self.max_ns)
+        return self.max_ns
+
+    def as_dict(self):
+        return {
+            "name":      self.name,
+            "count":     self.count,
+            "total_ns":  self.total_ns,
+            "self_ns":   self.self_ns,
+            "min_ns":    self.min_ns or 0,
+            "max_ns":    self.max_ns,
+            "mean_ns":   self.total_ns // self.count if self.count else 0,
+            "p50_ns":    self.percentile(0.50),
+            "p95_ns":    self.percentile(0.95),
+            "histogram": {1 << index: value for index, value in enumerate(self.histogram) if value},
+        }
+
+
+#*******************************************************************
+# STATE
+def enable():
+    """Start recording spans."""
+    global _enabled
+    _enabled = True
+
+def disable():
+    """Stop recording spans; decorated functions go back to a near-free pass-through."""
+    global _enabled
+    _enabled = False
+
+def is_enabled():
+    return _enabled
+
+def reset():
+    """Drop all recorded spans and statistics."""
+    with _registry_lock:
+        _events.clear()
+        for thread_stats in _registry:
+            thread_stats.clear()
+
+def _thread_state():
+    """Return (span stack, stats dict) for the current thread, creating them on first use."""
+    try:
+        return _local.stack, _local.stats
+    except AttributeError:
+        _local.stack = []
+        _local.stats = {}
+        with _registry_lock:
+            _registry.append(_local.stats)
+        return _local.stack, _local.stats
+
+
+#*******************************************************************
+# RECORDING
+def _begin(name):
+    stack, _ = _thread_state()
+    # frame layout: [name, start_ns, child_ns]
+    frame = [name, _clock(), 0]
+    stack.append(frame)
+    return frame
+
+def _end(frame):
+    end_ns = _clock()
+    stack, stats = _thread_state()
+    stack.pop()
+
+    name, start_ns, child_ns = frame
+    duration_ns = end_ns - start_ns
+    if stack:
+        stack[-1][2] += duration_ns
+
+    entry = stats.get(name)
+    if entry is None:
+        entry = stats[name] = FunctionStats(name)
+    entry.add(duration_ns, duration_ns - child_ns)
+    _events.append((name, threading.get_ident(), start_ns, duration_ns, len(stack)))
+
+
+class span:
+    """Context manager recording a named block as a nested span."""
+
+    __slots__ = ("name", "_frame")
+
+    def __init__(self, name):
+        self.name   = name
+        self._frame = None
+
+    def __enter__(self):
+        if _enabled:
+            self._frame = _begin(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._frame is not None:
+            _end(self._frame)
+            self._frame = None
+        return False
+
+
+def trace(func=None, name=None):
+    """
+    Decorator recording each call of func as a span.
+
+    Usable bare (@trace) or with an explicit span name (@trace(name="ChainTool.create_chain")).
+    """
+    if func is None:
+        return functools.partial(trace, name=name)
+
+    span_name = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        frame = _begin(span_name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _end(frame)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def instrument(cls, methods=None):
+    """
+    Wrap methods of cls with trace in place, named "<Class>.<method>".
+
+    Lets existing tools such as ChainTool or ArLoad be traced without editing their source.
+    Without an explicit methods list every public and underscore method defined on the class
+    itself is wrapped; dunder methods are left alone.
+    """
+    names = methods or [attr for attr, value in vars(cls).items()
+                        if inspect.isfunction(value) and not attr.startswith("__")]
+
+    for attr in names:
+        method = vars(cls).get(attr)
+        if not inspect.isfunction(method) or getattr(method, "__traced__", False):
+            continue
+        setattr(cls, attr, trace(method, name=f"{cls.__name__}.{attr}"))
+    return cls
+
+
+#*******************************************************************
+# OUTPUT
+def stats():
+    """Return merged FunctionStats for all threads, keyed by span name."""
+    merged = {}
+    with _registry_lock:
+        for thread_stats in _registry:
+            for name, entry in list(thread_stats.items()):
+                if name not in merged:
+                    merged[name] = FunctionStats(name)
+                merged[name].merge(entry)
+    return merged
+
+def report(sort_by="total_ns", limit=30):
+    """Print a table of the slowest traced names."""
+    rows = sorted(stats().values(), key=lambda entry: getattr(entry, sort_by), reverse=True)
+
+    print(f"{'name':<48} {'calls':>8} {'total ms':>10} {'self ms':>10} {'mean us':>10} {'p95 us':>10}")
+    for entry in rows[:limit]:
+        print(f"{entry.name[:48]:<48} {entry.count:>8} "
+              f"{entry.total_ns / 1e6:>10.3f} {entry.self_ns / 1e6:>10.3f} "
+              f"{entry.total_ns / entry.count / 1e3:>10.2f} {entry.percentile(0.95) / 1e3:>10.2f}")
+
+def export_chrome_trace(path):
+    """
+    Write recorded spans as Chrome trace-event JSON (complete "X" events, microseconds).
+
+    Returns the number of spans written.
+    """
+    pid = os.getpid()
+    thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+    events = list(_events)
+    origin = min((event[2] for event in events), default=0)
+
+    trace_events = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+        for tid, thread_name in thread_names.items()
+    ]
+    for name, tid, start_ns, duration_ns, depth in events:
+        trace_events.append({
+            "name": name,
+            "cat":  "python",
+            "ph":   "X",
+            "pid":  pid,
+            "tid":  tid,
+            "ts":   (start_ns - origin) / 1000.0,
+            "dur":  duration_ns / 1000.0,
+            "args": {"depth": depth},
+        })
+
+    with open(path, 'w') as file:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
+    return len(events)
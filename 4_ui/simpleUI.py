@@ -8,9 +8,14 @@
 
 import os
 import sys
-import webbrowser
 
-from Qt import QtWidgets, QtGui, QtCore, QtCompat
+from Qt import QtWidgets, QtGui, QtCore
+
+import ui_cache
+from lazy_import import lazy_import
+
+# only needed when help is pressed
+webbrowser = lazy_import("webbrowser")
 
 
 #*******************************************************************
@@ -25,8 +30,8 @@ class SimpleUI():
         # BUILD local ui path
         path_ui = ("/").join([os.path.dirname(__file__), "ui", TITLE + ".ui"])
 
-        # LOAD ui with absolute path
-        self.wgUtil = QtCompat.loadUi(path_ui)
+        # LOAD ui with absolute path (compiled and cached after the first launch)
+        self.wgUtil = ui_cache.load_ui(path_ui)
 
         # BUTTON
         self.wgUtil.btnAccept.clicked.connect(self.press_accept)
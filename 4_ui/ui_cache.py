@@ -0,0 +1,242 @@
+# UI CACHE *********************************************************************
+# content = compiled .ui cache shared by the Qt tools
+#
+# date    = 2026-10-18
+# email   = yijie.beth.guan@gmail.com
+#*******************************************************************************
+
+"""
+Load Qt Designer .ui files without parsing the XML on every launch.
+
+The first load_ui() of a .ui file compiles it to a Python module with the binding's uic
+(pyside2-uic, pyside6-uic or PyQt's uic) and caches it under a name keyed by the file's hash
+and the binding. Later launches import the cached module, or its .pyc, and build the widgets
+directly. When no compiler is available, or the cached module fails, it falls back to
+QtCompat.loadUi / QUiLoader. Editing the .ui changes its hash, so stale modules are never used.
+
+    import ui_cache
+    self.window = ui_cache.load_ui(ui_cache.find_ui("Chain_GUI.ui", os.path.dirname(__file__)))
+
+Measure startup time (runs headless):
+    python 4_ui/ui_cache.py --measure 0_app/Chain_GUI.ui 4_ui/ui/simpleUI.ui
+"""
+
+import os
+import sys
+import time
+import shutil
+import hashlib
+import tempfile
+import subprocess
+import importlib.util
+import xml.etree.ElementTree as ElementTree
+
+
+#*******************************************************************
+# VARIABLE
+CACHE_DIR = os.environ.get("PYCLASS_UI_CACHE",
+                           os.path.join(os.path.expanduser("~"), ".cache", "pyclass_ui"))
+
+# compilers tried per binding, first one found on PATH wins
+UIC_COMMANDS = {
+    "PySide2": [["pyside2-uic"], ["uic", "-g", "python"]],
+    "PySide6": [["pyside6-uic"], ["uic", "-g", "python"]],
+    "PyQt5":   [["pyuic5"]],
+    "PyQt6":   [["pyuic6"]],
+}
+
+# milliseconds taken by the most recent load of each .ui path, and how it was loaded
+LOAD_TIMES = {}
+
+_modules = {}
+
+
+#*******************************************************************
+# QT
+def _qt():
+    """Return (binding name, QtWidgets, QtCore) preferring Qt.py like the rest of the tools."""
+    try:
+        import Qt
+        from Qt import QtWidgets, QtCore
+        return Qt.__binding__, QtWidgets, QtCore
+    except ImportError:
+        pass
+
+    for binding in ("PySide2", "PySide6"):
+        try:
+            module = __import__(binding, fromlist=["QtWidgets", "QtCore"])
+            return binding, module.QtWidgets, module.QtCore
+        except ImportError:
+            continue
+    raise ImportError("No Qt binding found (Qt.py, PySide2 or PySide6)")
+
+def _runtime_load(path, parent=None):
+    """Parse the .ui at runtime, the way the tools did before caching."""
+    try:
+        from Qt import QtCompat
+        # loadUi has no parent argument (its baseinstance loads into an existing widget instead)
+        widget = QtCompat.loadUi(path)
+        if parent is not None:
+            widget.setParent(parent, widget.windowFlags())
+        return widget
+    except ImportError:
+        pass
+
+    binding, _, QtCore = _qt()
+    QtUiTools = __import__(binding, fromlist=["QtUiTools"]).QtUiTools
+    ui_file = QtCore.QFile(path)
+    ui_file.open(QtCore.QFile.ReadOnly)
+    try:
+        return QtUiTools.QUiLoader().load(ui_file, parent)
+    finally:
+        ui_file.close()
+
+
+#*******************************************************************
+# CACHE
+def find_ui(file_name, *search_dirs):
+    """
+    Return the first existing file_name in search_dirs or their "ui" subfolders.
+    Raises IOError listing every place looked at.
+    """
+    tried = []
+    for folder in search_dirs:
+        if not folder:
+            continue
+        for candidate in (os.path.join(folder, file_name), os.path.join(folder, "ui", file_name)):
+            candidate = os.path.normpath(candidate)
+            if os.path.exists(candidate):
+                return candidate
+            tried.append(candidate)
+    raise IOError(f"UI file {file_name} not found. Looked in: {', '.join(tried)}")
+
+def _cache_key(path, binding):
+    with open(path, 'rb') as file:
+        digest = hashlib.sha1(file.read()).hexdigest()[:16]
+    stem = "".join(char if char.isalnum() else "_" for char in os.path.splitext(os.path.basename(path))[0])
+    return f"ui_{stem}_{binding}_{digest}"
+
+def _ui_classes(path):
+    """Form class and top-level widget class from the .ui XML (only needed when compiling)."""
+    root = ElementTree.parse(path).getroot()
+    return root.findtext("class"), root.find("widget").get("class")
+
+def _find_compiler(binding):
+    for command in UIC_COMMANDS.get(binding, []):
+        executable = shutil.which(command[0])
+        if executable:
+            return [executable] + command[1:]
+    return None
+
+def compile_ui(path, binding=None, cache_dir=CACHE_DIR):
+    """Compile path into the cache if it is not there yet; return the module path or None."""
+    binding     = binding or _qt()[0]
+    module_path = os.path.join(cache_dir, _cache_key(path, binding) + ".py")
+    if os.path.exists(module_path):
+        return module_path
+
+    compiler = _find_compiler(binding)
+    if not compiler:
+        return None
+
+    form_class, base_class = _ui_classes(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    handle, tmp_path = tempfile.mkstemp(suffix=".py", dir=cache_dir)
+    os.close(handle)
+    try:
+        subprocess.run(compiler + [path, "-o", tmp_path], check=True, capture_output=True)
+        with open(tmp_path, 'a') as file:
+            file.write(f"\n\nUI_CLASS = 'Ui_{form_class}'\nUI_BASE = '{base_class}'\n")
+        # concurrent launches compile to their own temp file; the rename is atomic
+        os.replace(tmp_path, module_path)
+    except (OSError, subprocess.CalledProcessError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
+    return module_path
+
+def _import_cached(module_path):
+    name = os.path.splitext(os.path.basename(module_path))[0]
+    if name not in _modules:
+        spec   = importlib.util.spec_from_file_location(name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return _modules[name]
+
+def _build(module, QtWidgets, parent):
+    """Instantiate the compiled form on its base widget; children become widget attributes like loadUi."""
+    widget = getattr(QtWidgets, module.UI_BASE)(parent)
+    form   = getattr(module, module.UI_CLASS)()
+    form.setupUi(widget)
+    for name, child in vars(form).items():
+        setattr(widget, name, child)
+    widget.ui = form
+    return widget
+
+def load_ui(path, parent=None, cache_dir=CACHE_DIR):
+    """Build the widget tree of a .ui file, from the compiled cache when possible."""
+    start = time.perf_counter()
+    path  = os.path.abspath(path)
+    binding, QtWidgets, _ = _qt()
+
+    widget, source = None, "runtime"
+    try:
+        module_path = compile_ui(path, binding, cache_dir)
+        if module_path:
+            widget, source = _build(_import_cached(module_path), QtWidgets, parent), "cache"
+    except Exception as error:
+        print(f"[ui_cache] cached UI failed for {path}, loading at runtime: {error}")
+
+    if widget is None:
+        widget = _runtime_load(path, parent)
+
+    LOAD_TIMES[path] = ((time.perf_counter() - start) * 1000.0, source)
+    return widget
+
+def clear_cache(cache_dir=CACHE_DIR):
+    _modules.clear()
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+#*******************************************************************
+# MEASURE
+def measure(paths, repeat=20):
+    """
+    Print per-file load time for runtime parsing vs the compiled cache (first compile excluded).
+    Runs headless through the offscreen platform when no display is set.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _, QtWidgets, _ = _qt()
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+    print(f"{'ui file':<40} {'runtime ms':>12} {'cached ms':>12} {'speedup':>8}")
+    for path in paths:
+        path = os.path.abspath(path)
+        compile_start = time.perf_counter()
+        compile_ui(path)
+        compile_ms = (time.perf_counter() - compile_start) * 1000.0
+
+        timings = {}
+        for label, loader in (("runtime", lambda: _runtime_load(path)), ("cached", lambda: load_ui(path))):
+            best = float("inf")
+            for _ in range(repeat):
+                start  = time.perf_counter()
+                widget = loader()
+                best   = min(best, time.perf_counter() - start)
+                widget.deleteLater()
+            timings[label] = best * 1000.0
+            app.processEvents()
+
+        source = LOAD_TIMES.get(path, (0, "runtime"))[1]
+        print(f"{os.path.basename(path):<40} {timings['runtime']:>12.2f} {timings['cached']:>12.2f} "
+              f"{timings['runtime'] / timings['cached']:>7.1f}x  ({source}, first compile {compile_ms:.0f} ms)")
+
+
+#*******************************************************************
+# START
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"] and sys.argv[2:]:
+        measure(sys.argv[2:])
+    else:
+        print("usage: python ui_cache.py --measure <file.ui> [<file.ui> ...]")
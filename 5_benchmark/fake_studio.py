@@ -0,0 +1,155 @@
+#******************************************************************************************************************************
+
+#content       = Studio pipeline stand-ins for benchmarks
+
+#version       = 0.1.0
+
+#date          = October 18th
+
+#dependencies  = none
+
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+
+#******************************************************************************************************************************
+
+"""
+Minimal Qt and pipeline modules (libLog, libFunc, arUtil, tank, ...) so 21_arload.py can be
+imported and driven headless. Only the surface ArLoad touches is provided.
+"""
+
+import os
+import sys
+import types
+import importlib.util
+
+
+#*******************************************************************
+# WIDGETS
+class Signal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+
+class ListItem:
+    __slots__ = ("_text",)
+
+    def __init__(self, text):
+        self._text = text
+
+    def text(self):
+        return self._text
+
+
+class ListWidget:
+    """Headless QListWidget covering what ArLoad uses."""
+
+    def __init__(self):
+        self.items   = []
+        self.row     = -1
+        self.visible = True
+        self.itemSelectionChanged = Signal()
+
+    def clear(self):
+        self.items = []
+        self.row   = -1
+
+    def addItems(self, texts):
+        self.items.extend(ListItem(text) for text in texts)
+
+    def count(self):
+        return len(self.items)
+
+    def item(self, index):
+        return self.items[index]
+
+    def currentItem(self):
+        return self.items[self.row] if 0 <= self.row < len(self.items) else None
+
+    def setCurrentRow(self, row):
+        self.row = row
+
+    def hide(self):
+        self.visible = False
+
+    def show(self):
+        self.visible = True
+
+
+class Label:
+    def __init__(self):
+        self.value = ''
+
+    def setText(self, text):
+        self.value = text
+
+
+class LoadWidget:
+    def __init__(self):
+        for name in ("lstScene", "lstStatus", "lstSet", "lstAsset", "lstTask"):
+            setattr(self, name, ListWidget())
+
+    def show(self):
+        pass
+
+
+class PreviewWidget:
+    def __init__(self):
+        for name in ("lblUser", "lblTitle", "lblDate", "lblSize"):
+            setattr(self, name, Label())
+
+
+#*******************************************************************
+# MODULES
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+def get_file_list(path):
+    """Stand-in for libFunc.get_file_list: plain directory listing."""
+    try:
+        return os.listdir(path)
+    except OSError:
+        return []
+
+def install(project_data):
+    """Register fake Qt and pipeline modules; ArUtil exposes project_data as self.data."""
+
+    class ArUtil:
+        def __init__(self):
+            self.data      = project_data
+            self.wgPreview = PreviewWidget()
+
+        def resize_widget(self, widget):
+            pass
+
+        def set_status(self, message, msg_type=1):
+            pass
+
+    class Log:
+        def info(self, message):
+            pass
+
+    qt = _module("Qt", QtWidgets=None, QtGui=None, QtCore=None,
+                 QtCompat=types.SimpleNamespace(loadUi=lambda path: LoadWidget()))
+    _module("ui_cache", load_ui=lambda path, parent=None: LoadWidget())
+    _module("libLog", init=lambda script=None: Log())
+    _module("libData")
+    _module("libFunc", get_file_list=get_file_list)
+    _module("arNotice")
+    _module("arSaveAs", start=lambda new_file=False: None)
+    _module("tank", Tank=object)
+    _module("arUtil", ArUtil=ArUtil)
+    return qt
+
+def load_arload(path, project_data):
+    """Import 21_arload.py (not a valid module name) against the fakes."""
+    install(project_data)
+    spec   = importlib.util.spec_from_file_location("arload", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
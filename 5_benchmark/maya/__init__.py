@@ -0,0 +1,6 @@
+"""
+Stand-in for the maya package used by the benchmark harness.
+
+Only importable when 5_benchmark is first on sys.path; inside a real Maya session the
+actual package always wins.
+"""
@@ -0,0 +1,304 @@
+#******************************************************************************************************************************
+
+#content       = Recording maya.cmds stand-in
+
+#version       = 0.1.0
+
+#date          = October 18th
+
+#dependencies  = none
+
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+
+#******************************************************************************************************************************
+
+"""
+Fake maya.cmds that records every call and simulates a fixed per-call latency.
+
+It keeps a tiny scene (node name -> attribute dict) and a table of UI control values so the
+studio tools can run end to end on plain Linux. Any command not implemented here is recorded
+and returns None.
+"""
+
+import os
+import time
+from collections import Counter
+
+# simulated cost of one interpreter-to-Maya round trip, in nanoseconds
+LATENCY_NS = 5000
+
+# keep (command, args, kwargs) of every call; switch off for very long runs
+RECORD_ARGS = True
+
+calls    = []
+counts   = Counter()
+warnings = []
+
+# time the fakes spend on their own bookkeeping, subtracted from benchmark timings
+fake_overhead_ns = 0
+
+_scene      = {}
+_ui_values  = {}
+_selection  = []
+_workspace  = {"rootDirectory": os.getcwd()}
+_name_index = Counter()
+
+# undo: one journal per closed chunk, {node name: node dict before the chunk, or None if new}
+_undo_chunks = []
+_open_chunk  = None
+_chunk_depth = 0
+
+DEFAULT_BBOX = [-1.0, -0.5, -2.0, 1.0, 0.5, 2.0]
+
+
+#*******************************************************************
+# RECORDER
+def reset(root_directory=None):
+    """Clear recorded calls, scene and UI state."""
+    global fake_overhead_ns
+    fake_overhead_ns = 0
+    calls.clear()
+    counts.clear()
+    warnings.clear()
+    _scene.clear()
+    _ui_values.clear()
+    _selection[:] = []
+    _name_index.clear()
+    _undo_chunks.clear()
+    global _open_chunk, _chunk_depth
+    _open_chunk, _chunk_depth = None, 0
+    if root_directory:
+        _workspace["rootDirectory"] = root_directory
+
+def set_ui_value(control, value):
+    """Preset the value a UI control returns when queried."""
+    _ui_values[control] = value
+
+def add_node(name, bbox=None, **attrs):
+    """Create a scene node directly, without recording a call."""
+    node = {"bbox": list(bbox or DEFAULT_BBOX)}
+    node.update(attrs)
+    _scene[name] = node
+    return name
+
+def select_nodes(*names):
+    _selection[:] = list(names)
+
+def node(name):
+    return _scene[name]
+
+def call_count():
+    return sum(counts.values())
+
+def _simulate_latency():
+    if LATENCY_NS:
+        end = time.perf_counter_ns() + LATENCY_NS
+        while time.perf_counter_ns() < end:
+            pass
+
+def _command(func):
+    """Record the call and pay the simulated round trip before running the fake body."""
+    name = func.__name__
+
+    def wrapper(*args, **kwargs):
+        counts[name] += 1
+        if RECORD_ARGS:
+            calls.append((name, args, kwargs))
+        _simulate_latency()
+        return func(*args, **kwargs)
+
+    wrapper.__name__    = name
+    wrapper.__doc__     = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+def __getattr__(name):
+    """Any other command is recorded and returns None."""
+    if name.startswith("__"):
+        raise AttributeError(name)
+
+    def unknown(*args, **kwargs):
+        return None
+
+    unknown.__name__ = name
+    return _command(unknown)
+
+def _flatten(names):
+    """Commands take node names as separate arguments or as lists."""
+    flat = []
+    for name in names:
+        flat.extend(name if isinstance(name, (list, tuple)) else [name])
+    return flat
+
+def _touch(name):
+    """Remember a node's state the first time the open undo chunk changes it."""
+    if _open_chunk is not None and name not in _open_chunk:
+        node_data = _scene.get(name)
+        _open_chunk[name] = None if node_data is None else dict(node_data)
+
+def _split_plug(plug):
+    node_name, _, attr = plug.partition(".")
+    return node_name, attr
+
+
+#*******************************************************************
+# SCENE
+@_command
+def workspace(*args, **kwargs):
+    if kwargs.get("query") and (kwargs.get("rootDirectory") or kwargs.get("rd")):
+        return _workspace["rootDirectory"]
+    return None
+
+@_command
+def undoInfo(*args, **kwargs):
+    """Chunks nest; only the outermost one becomes an undo step."""
+    global _open_chunk, _chunk_depth
+    if kwargs.get("query") or kwargs.get("q"):
+        return True
+    if kwargs.get("openChunk"):
+        _chunk_depth += 1
+        if _chunk_depth == 1:
+            _open_chunk = {}
+    elif kwargs.get("closeChunk") and _chunk_depth:
+        _chunk_depth -= 1
+        if _chunk_depth == 0:
+            _undo_chunks.append(_open_chunk)
+            _open_chunk = None
+
+@_command
+def undo(*args, **kwargs):
+    """Restore the nodes changed by the last closed chunk."""
+    if not _undo_chunks:
+        return
+    for name, previous in _undo_chunks.pop().items():
+        if previous is None:
+            _scene.pop(name, None)
+        else:
+            _scene[name] = previous
+
+@_command
+def warning(message):
+    warnings.append(message)
+
+@_command
+def objExists(name):
+    return name in _scene
+
+@_command
+def ls(*args, **kwargs):
+    if kwargs.get("selection") or kwargs.get("sl"):
+        return list(_selection)
+    if args:
+        return [name for name in _flatten(args) if name in _scene]
+    return list(_scene)
+
+@_command
+def listRelatives(name, shapes=False, fullPath=False, **kwargs):
+    shape = name + "Shape"
+    return [shape] if shape in _scene else []
+
+@_command
+def nodeType(name):
+    return _scene.get(name, {}).get("type", "transform")
+
+@_command
+def exactWorldBoundingBox(name, **kwargs):
+    return list(_scene[name]["bbox"])
+
+@_command
+def instance(name, **kwargs):
+    source = _scene[name]
+    _name_index[name] += 1
+    new_name = kwargs.get("name") or kwargs.get("n") or f"{name}{_name_index[name]}"
+    _touch(new_name)
+    _scene[new_name] = {"bbox": list(source["bbox"]), "instanceOf": name}
+    return [new_name]
+
+@_command
+def scale(x, y, z, name, **kwargs):
+    _touch(name)
+    _scene[name].update(scaleX=x, scaleY=y, scaleZ=z)
+
+@_command
+def move(x, y, z, name=None, **kwargs):
+    if name in _scene:
+        _touch(name)
+        _scene[name].update(translateX=x, translateY=y, translateZ=z)
+
+@_command
+def setAttr(plug, *values, **kwargs):
+    node_name, attr = _split_plug(plug)
+    if node_name not in _scene:
+        raise RuntimeError(f"No object matches name: {plug}")
+    _touch(node_name)
+    _scene[node_name][attr] = values[0] if len(values) == 1 else list(values)
+
+@_command
+def getAttr(plug, **kwargs):
+    node_name, attr = _split_plug(plug)
+    if node_name not in _scene:
+        raise ValueError(f"No object matches name: {plug}")
+    return _scene[node_name].get(attr, 0)
+
+@_command
+def file(path=None, **kwargs):
+    if kwargs.get("i") or kwargs.get("import"):
+        name = os.path.splitext(os.path.basename(path))[0]
+        _touch(name)
+        _scene.setdefault(name, {"bbox": list(DEFAULT_BBOX)})
+        return path
+    return path
+
+@_command
+def delete(*names, **kwargs):
+    if kwargs.get("constructionHistory") or kwargs.get("ch"):
+        return
+    for name in _flatten(names):
+        _touch(name)
+        _scene.pop(name, None)
+
+
+#*******************************************************************
+# UI
+def _ui_control(func):
+    """UI commands return the preset value on query and the control name otherwise."""
+    def body(*args, **kwargs):
+        control = args[0] if args else f"{func.__name__}{len(_ui_values) + 1}"
+        if kwargs.get("query") or kwargs.get("q"):
+            if kwargs.get("exists"):
+                return control in _ui_values
+            return _ui_values.get(control)
+        if kwargs.get("deleteAllItems"):
+            _ui_values.pop(control + ":items", None)
+            return control
+        _ui_values.setdefault(control, kwargs.get("value"))
+        return control
+
+    body.__name__ = func.__name__
+    return _command(body)
+
+@_ui_control
+def optionMenu(): pass
+
+@_ui_control
+def floatFieldGrp(): pass
+
+@_ui_control
+def floatSliderGrp(): pass
+
+@_ui_control
+def intField(): pass
+
+@_command
+def menuItem(*args, **kwargs):
+    parent = kwargs.get("parent")
+    if parent is not None:
+        _ui_values.setdefault(parent + ":items", []).append(kwargs.get("label"))
+    return kwargs.get("label")
+
+@_command
+def window(name=None, **kwargs):
+    if kwargs.get("exists"):
+        return name in _ui_values
+    _ui_values[name] = None
+    return name
@@ -0,0 +1,85 @@
+#******************************************************************************************************************************
+
+#content       = Recording maya.mel stand-in
+
+#version       = 0.1.0
+
+#date          = October 18th
+
+#dependencies  = fake maya.cmds
+
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+
+#******************************************************************************************************************************
+
+"""
+Fake maya.mel. eval() is recorded and costs one simulated round trip like any cmds call, plus
+a small per-statement cost for the work Maya does inside the script.
+
+It understands the line-per-statement scripts written by maya_batch.CommandBatch (instance and
+setAttr statements collected into $created) and applies them to the fake scene; other lines
+are ignored. Time spent interpreting the script in Python is fake bookkeeping, not Maya work,
+so it is added to cmds.fake_overhead_ns and left out of benchmark timings.
+"""
+
+import re
+import time
+
+from maya import cmds
+
+INSTANCE_LINE = re.compile(r'^\$node = `instance (?:-name "(?P<name>[^"]+)" )?(?P<source>\S+)`; \$created\[(?P<slot>\d+)\]')
+SETATTR_LINE  = re.compile(r'^setAttr (?P<plug>\(\$created\[(?P<slot>\d+)\] \+ "\.(?P<attr>[^"]+)"\)|"[^"]+")(?P<rest>.*);$')
+CREATED_SLOT  = re.compile(r'^\$created\[(\d+)\]$')
+
+# simulated cost of one statement executed inside Maya, in nanoseconds
+STATEMENT_NS = 500
+
+
+def _value(token):
+    try:
+        return float(token) if "." in token or "e" in token else int(token)
+    except ValueError:
+        return token
+
+def _source_name(token, created):
+    match = CREATED_SLOT.match(token)
+    return created[int(match.group(1))] if match else token.strip('"')
+
+def _run(script):
+    created = []
+    for line in script.splitlines():
+        match = INSTANCE_LINE.match(line)
+        if match:
+            kwargs = {"name": match.group("name")} if match.group("name") else {}
+            node = cmds.instance.__wrapped__(_source_name(match.group("source"), created), **kwargs)[0]
+            created.append(node)
+            continue
+
+        match = SETATTR_LINE.match(line)
+        if match:
+            if match.group("slot") is not None:
+                plug = f"{created[int(match.group('slot'))]}.{match.group('attr')}"
+            else:
+                plug = match.group("plug").strip('"')
+
+            tokens = match.group("rest").split()
+            if tokens[:1] == ["-type"]:
+                tokens = tokens[2:]
+            cmds.setAttr.__wrapped__(plug, *[_value(token.strip('"')) for token in tokens])
+    return created
+
+def eval(script):
+    cmds.counts["mel.eval"] += 1
+    if cmds.RECORD_ARGS:
+        cmds.calls.append(("mel.eval", (script,), {}))
+    cmds._simulate_latency()
+
+    start   = time.perf_counter_ns()
+    created = _run(script)
+    cmds.fake_overhead_ns += time.perf_counter_ns() - start
+
+    if STATEMENT_NS:
+        end = time.perf_counter_ns() + STATEMENT_NS * script.count(";")
+        while time.perf_counter_ns() < end:
+            pass
+    return created
@@ -0,0 +1,274 @@
+#******************************************************************************************************************************
+
+#content       = Benchmark suite
+
+#version       = 0.1.0
+
+#date          = October 18th
+
+#dependencies  = fake maya.cmds (5_benchmark/maya), fake_studio
+
+#author        = Elizabeth Guan <yijie.beth.guan@gmail.com>
+
+#******************************************************************************************************************************
+
+"""
+Run the studio tools against the recording maya.cmds stand-in and save timings as JSON.
+
+    python 5_benchmark/run_benchmarks.py                      # full run, writes results/bench_<time>.json
+    python 5_benchmark/run_benchmarks.py --quick              # smaller sizes
+    python 5_benchmark/run_benchmarks.py --compare results/bench_<time>.json
+
+Every result records the best and median wall time plus how many cmds calls the run made,
+so both slowdowns and extra Maya round trips show up as regressions.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import contextlib
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+
+# the fake maya package must win over any real installation
+sys.path.insert(0, HERE)
+sys.path.insert(1, os.path.join(REPO, "0_app"))
+sys.path.insert(2, os.path.join(REPO, "1_tools"))
+# ahead of site-packages, which may hold the unrelated PyPI "decorator"
+sys.path.insert(3, os.path.join(REPO, "3_advanced"))
+
+import maya.cmds as cmds
+import fake_studio
+import chain_creation
+
+CHAIN_SIZES       = [10, 100, 1000, 10000, 100000]
+QUICK_CHAIN_SIZES = [10, 100, 1000]
+SHAPE             = "chainRound"
+
+# a regression is flagged when a result is this much slower than the baseline
+REGRESSION_RATIO = 1.2
+
+
+#*******************************************************************
+# HELPERS
+@contextlib.contextmanager
+def quiet():
+    """Swallow the tools' [DEBUG] prints while timing."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+def measure(name, params, run, setup=None, repeat=3):
+    """Time run() repeat times; setup() runs untimed before each repeat and its result is passed on."""
+    timings = []
+    calls   = 0
+    for _ in range(repeat):
+        state = setup() if setup else None
+        cmds.calls.clear()
+        cmds.counts.clear()
+        cmds.warnings.clear()
+        cmds.fake_overhead_ns = 0
+        with quiet():
+            start = time.perf_counter()
+            run(state)
+            timings.append(time.perf_counter() - start - cmds.fake_overhead_ns / 1e9)
+        calls = cmds.call_count()
+
+    result = {
+        "name":     name,
+        "params":   params,
+        "repeat":   repeat,
+        "best_s":   min(timings),
+        "median_s": statistics.median(timings),
+        "calls":    calls,
+        "warnings": list(cmds.warnings[:5]),
+    }
+    print(f"{name:<28} {json.dumps(params):<28} best {result['best_s'] * 1e3:>10.2f} ms"
+          f"  median {result['median_s'] * 1e3:>10.2f} ms  calls {calls:>8}")
+    return result
+
+def new_tool(root):
+    """A ChainTool bound to root as its Maya project, with UI controls preset."""
+    os.makedirs(root, exist_ok=True)
+    cmds.reset(root_directory=root)
+    with quiet():
+        tool = chain_creation.ChainTool()
+
+    tool.shape_menu       = "shapeMenu"
+    tool.scale_field_grp  = "scaleFieldGrp"
+    tool.z_offset_field   = "zOffsetField"
+    tool.link_count_field = "linkCountField"
+    cmds.set_ui_value("scaleFieldGrp", [1.0, 1.0, 1.0])
+    cmds.set_ui_value("zOffsetField", 0.8)
+    return tool
+
+def make_assets(folder, count, extension=".fbx"):
+    os.makedirs(folder, exist_ok=True)
+    for index in range(count):
+        open(os.path.join(folder, f"asset_{index:05d}{extension}"), 'w').close()
+
+def make_project_tree(root, width):
+    """
+    Build shots (4-level rule) and assets (5-level rule) trees:
+        shots/seq_i/shot_j/task_k   and   assets/type_i/asset_j/task_k
+    """
+    paths = {"shots": os.path.join(root, "shots"), "assets": os.path.join(root, "assets")}
+    for scene, level_names in (("shots", ("seq", "shot")), ("assets", ("type", "asset"))):
+        for first in range(width):
+            for second in range(width):
+                base = os.path.join(paths[scene], f"{level_names[0]}_{first:03d}", f"{level_names[1]}_{second:03d}")
+                for task in ("anim", "light", "model", "rig"):
+                    os.makedirs(os.path.join(base, task))
+    return {
+        "project":  {"PATH": paths},
+        "rules":    {"SCENES": {"shots": "a/b/c/d", "assets": "a/b/c/d/e"}},
+        "software": {"EXTENSION": {"maya": "mb", "houdini": "hipnc"}},
+    }
+
+
+#*******************************************************************
+# BENCHMARKS
+def bench_create_chain(root, sizes, repeat):
+    results = []
+    for link_count in sizes:
+        def setup():
+            tool = new_tool(root)
+            cmds.add_node(SHAPE)
+            cmds.set_ui_value("shapeMenu", SHAPE)
+            cmds.set_ui_value("linkCountField", link_count)
+            return tool
+
+        results.append(measure("create_chain", {"links": link_count},
+                               lambda tool: tool.create_chain(), setup, repeat))
+    return results
+
+def bench_populate_shape_menu(root, asset_count, repeat):
+    tool = new_tool(root)
+    # non-fbx noise so the extension filter is exercised
+    make_assets(os.path.join(root, "assets"), asset_count)
+    make_assets(os.path.join(root, "assets"), asset_count // 10, extension=".ma")
+    return [measure("populate_shape_menu", {"assets": asset_count},
+                    lambda _: tool.populate_shape_menu(), repeat=repeat)]
+
+def bench_config(root, iterations, repeat):
+    tool = new_tool(root)
+
+    def load(_):
+        for _ in range(iterations):
+            tool._load_or_create_config()
+
+    def save(_):
+        for _ in range(iterations):
+            tool._save_config()
+
+    return [measure("config_load", {"iterations": iterations}, load, repeat=repeat),
+            measure("config_save", {"iterations": iterations}, save, repeat=repeat)]
+
+def bench_arload_navigation(root, width, repeat):
+    data   = make_project_tree(os.path.join(root, "project"), width)
+    module = fake_studio.load_arload(os.path.join(REPO, "2_style", "21_arload.py"), data)
+    with quiet():
+        loader = module.ArLoad()
+    scenes = sorted(data["project"]["PATH"])
+
+    def navigate(_):
+        widget = loader.wgLoad
+        widget.lstScene.clear()
+        widget.lstScene.addItems(scenes)
+        for scene_row in range(len(scenes)):
+            widget.lstScene.setCurrentRow(scene_row)
+            loader.change_lstScene()
+            for set_row in range(widget.lstSet.count()):
+                widget.lstSet.setCurrentRow(set_row)
+                loader.change_lstSet()
+                if loader.scene_steps >= 5:
+                    for asset_row in range(widget.lstAsset.count()):
+                        widget.lstAsset.setCurrentRow(asset_row)
+                        loader.change_lstAsset()
+
+    return [measure("arload_navigation", {"width": width}, navigate, repeat=repeat)]
+
+
+#*******************************************************************
+# RESULTS
+def save_results(results, path, args):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = {
+        "timestamp":  time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python":     platform.python_version(),
+        "platform":   platform.platform(),
+        "latency_ns": cmds.LATENCY_NS,
+        "quick":      args.quick,
+        "results":    results,
+    }
+    with open(path, 'w') as file:
+        json.dump(payload, file, indent=4)
+    print(f"Saved results to {path}")
+
+def compare_results(results, baseline_path):
+    """Print the ratio against a previous run; return the number of regressions."""
+    with open(baseline_path, 'r') as file:
+        baseline = json.load(file)
+
+    previous    = {(entry["name"], json.dumps(entry["params"], sort_keys=True)): entry
+                   for entry in baseline["results"]}
+    regressions = 0
+
+    print(f"\nCompared with {baseline_path}")
+    for entry in results:
+        old = previous.get((entry["name"], json.dumps(entry["params"], sort_keys=True)))
+        if not old:
+            continue
+        ratio = entry["best_s"] / old["best_s"] if old["best_s"] else float("inf")
+        flag  = ""
+        if ratio > REGRESSION_RATIO or entry["calls"] > old["calls"]:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{entry['name']:<28} {json.dumps(entry['params']):<28} x{ratio:>6.2f}"
+              f"  calls {old['calls']} -> {entry['calls']}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller sizes for a fast smoke run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-us", type=float, default=cmds.LATENCY_NS / 1000.0,
+                        help="simulated cost of one cmds call")
+    parser.add_argument("--output", help="result JSON path (default results/bench_<time>.json)")
+    parser.add_argument("--compare", help="previous result JSON to compare against")
+    args = parser.parse_args(argv)
+
+    cmds.LATENCY_NS  = int(args.latency_us * 1000)
+    cmds.RECORD_ARGS = False
+
+    chain_sizes = QUICK_CHAIN_SIZES if args.quick else CHAIN_SIZES
+    asset_count = 1000 if args.quick else 10000
+    tree_width  = 8 if args.quick else 20
+
+    root = tempfile.mkdtemp(prefix="pyclass_bench_")
+    try:
+        results  = bench_create_chain(os.path.join(root, "chain"), chain_sizes, args.repeat)
+        results += bench_populate_shape_menu(os.path.join(root, "menu"), asset_count, args.repeat)
+        results += bench_config(os.path.join(root, "config"), 200, args.repeat)
+        results += bench_arload_navigation(os.path.join(root, "arload"), tree_width, args.repeat)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    output = args.output or os.path.join(HERE, "results", time.strftime("bench_%Y%m%d_%H%M%S.json"))
+    save_results(results, output, args)
+
+    if args.compare:
+        return 1 if compare_results(results, args.compare) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())